@@ -185,6 +185,39 @@ class AnalyticsDB:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_api_usage_name ON api_usage(api_name)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_suggestions_status ON suggestions(status)")
         
+        # Full-text index on questions (content engine team-question lookup),
+        # kept in sync with interactions by triggers
+        try:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'interactions_fts'")
+            fts_exists = cursor.fetchone() is not None
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS interactions_fts USING fts5(
+                    question, content='interactions', content_rowid='id'
+                )
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS interactions_fts_ai AFTER INSERT ON interactions BEGIN
+                    INSERT INTO interactions_fts(rowid, question) VALUES (new.id, new.question);
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS interactions_fts_ad AFTER DELETE ON interactions BEGIN
+                    INSERT INTO interactions_fts(interactions_fts, rowid, question)
+                    VALUES ('delete', old.id, old.question);
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS interactions_fts_au AFTER UPDATE OF question ON interactions BEGIN
+                    INSERT INTO interactions_fts(interactions_fts, rowid, question)
+                    VALUES ('delete', old.id, old.question);
+                    INSERT INTO interactions_fts(rowid, question) VALUES (new.id, new.question);
+                END
+            """)
+            if not fts_exists:
+                cursor.execute("INSERT INTO interactions_fts(interactions_fts) VALUES ('rebuild')")
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 unavailable, question search will use LIKE: {e}")
+        
         conn.commit()
         conn.close()
         logger.info(f"Enhanced analytics database initialized at {self.db_path}")
@@ -12,6 +12,7 @@ Requires:
 
 import json
 import logging
+import time
 from datetime import datetime
 from typing import Optional
 
@@ -19,6 +20,11 @@ import requests
 
 logger = logging.getLogger(__name__)
 
+# After a newer edge-function action fails (bulk candidate save, by-id candidate
+# lookup — e.g. an edge function deployed before the action existed), use the
+# older fallback for this long before retrying the action.
+_ACTION_RETRY_SECONDS = 3600
+
 
 class SupabaseAnalyticsDB:
     """
@@ -32,15 +38,19 @@ class SupabaseAnalyticsDB:
             "Content-Type": "application/json",
             "x-beacon-key": analytics_key,
         }
+        # One session per backend so edge-function calls reuse keep-alive connections
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self._bulk_save_failed_at: Optional[float] = None
+        self._by_id_failed_at: Optional[float] = None
         logger.info("Supabase analytics (edge function) initialized")
 
     def _call(self, action: str, data: dict = None) -> dict:
         """Call the beacon-analytics edge function."""
         try:
-            resp = requests.post(
+            resp = self.session.post(
                 self.base_url,
                 json={"action": action, "data": data or {}},
-                headers=self.headers,
                 timeout=15,
             )
             if resp.status_code != 200:
@@ -306,6 +316,31 @@ class SupabaseAnalyticsDB:
         result = self._call("save_content_candidate", candidate)
         return result or {}
 
+    def save_content_candidates(self, candidates: list[dict]) -> dict:
+        """Save several content candidates in one edge-function call.
+
+        Falls back to one save_content_candidate call per row if the bulk action
+        fails (e.g. an edge function deployed before it existed). The failure is
+        remembered for _ACTION_RETRY_SECONDS so later batches skip the bulk call.
+        Returns {"saved": n} with the number of rows actually saved on fallback.
+        """
+        if not candidates:
+            return {}
+        if (self._bulk_save_failed_at is None
+                or time.monotonic() - self._bulk_save_failed_at >= _ACTION_RETRY_SECONDS):
+            result = self._call("save_content_candidates", {"candidates": candidates})
+            if isinstance(result, dict) and result and "error" not in result:
+                self._bulk_save_failed_at = None
+                return result
+            self._bulk_save_failed_at = time.monotonic()
+            logger.warning("Bulk save_content_candidates failed; saving candidates one at a time")
+        saved = 0
+        for candidate in candidates:
+            result = self.save_content_candidate(candidate)
+            if isinstance(result, dict) and result and "error" not in result:
+                saved += 1
+        return {"saved": saved}
+
     def notify_ingest(self, title: str, body: str = None, link: str = None) -> dict:
         """Fire an in-app Ordino notification for a net-new KB ingest.
 
@@ -333,6 +368,29 @@ class SupabaseAnalyticsDB:
             logger.error(f"get_content_candidates failed: {e}")
             return []
 
+    def get_content_candidate(self, candidate_id: str) -> Optional[dict]:
+        """Get a single content candidate by id, or None if not found.
+
+        The edge function answers {"candidate": row-or-null}. If the by-id action
+        fails or answers anything else, that is remembered for _ACTION_RETRY_SECONDS
+        and lookups scan get_content_candidates(status="all") meanwhile.
+        """
+        if (self._by_id_failed_at is None
+                or time.monotonic() - self._by_id_failed_at >= _ACTION_RETRY_SECONDS):
+            result = self._call("get_content_candidate", {"id": candidate_id})
+            if isinstance(result, dict) and "error" not in result and "candidate" in result:
+                row = result["candidate"]
+                self._by_id_failed_at = None
+                if row is None:
+                    return None
+                if isinstance(row, dict) and row.get("id") == candidate_id:
+                    return row
+            self._by_id_failed_at = time.monotonic()
+        for row in self.get_content_candidates(status="all"):
+            if row.get("id") == candidate_id:
+                return row
+        return None
+
     def update_content_candidate(self, candidate_id: str, **kwargs) -> dict:
         """Update a content candidate's status, priority, etc."""
         result = self._call("update_content_candidate", {"id": candidate_id, **kwargs})
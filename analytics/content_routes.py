@@ -3,14 +3,33 @@ Flask routes for Content Intelligence dashboard
 Includes inline BASE_TEMPLATE (no imports) to avoid circular dependencies
 """
 
+import gzip
+import hashlib
+import io
+import json
 import logging
+import os
+import re
+import secrets
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 from datetime import datetime
+from typing import Optional
 
-from flask import Blueprint, render_template_string, request, jsonify
-from content_engine.engine import ContentEngine
-import traceback
+import requests
+from flask import Blueprint, Response, redirect, request, jsonify, session as flask_session, url_for
+from content_engine.engine import ContentCandidate, ContentEngine
 
 logger = logging.getLogger(__name__)
+# Optional fast JSON encoder for the large candidate/draft payloads
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Optional intelligent scorer
 try:
     from analytics.intelligent_scorer import IntelligentScorer
@@ -19,18 +38,82 @@ except ImportError:
     INTELLIGENT_SCORER_AVAILABLE = False
 
 content_bp = Blueprint('content', __name__)
-engine = ContentEngine()
+
+# Created on first use rather than at import, so app startup doesn't pay for
+# the engine's DB/client setup.
+_engine: Optional[ContentEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> ContentEngine:
+    """Get or create the shared content engine."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = ContentEngine()
+    return _engine
+
+
+def _json_response(payload: dict):
+    """Like jsonify(payload), but encoded with orjson when it's installed."""
+    if HAS_ORJSON:
+        return Response(orjson.dumps(payload), mimetype='application/json')
+    return jsonify(payload)
+
+
+def _request_json() -> dict:
+    """The request's JSON object body (orjson when installed), or {} if the body
+    is missing, malformed, not JSON-typed or not an object, so routes answer
+    with their own 400s instead of Flask's."""
+    if not request.is_json:
+        return {}
+    body = request.get_data(cache=False)
+    try:
+        data = orjson.loads(body) if HAS_ORJSON else json.loads(body)
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _json_bytes(payload: dict) -> bytes:
+    """payload as compact UTF-8 JSON, with orjson when it's installed."""
+    if HAS_ORJSON:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(',', ':')).encode('utf-8')
 
 
 @content_bp.before_request
 def check_auth():
     """Require login for all content engine routes."""
-    import os
-    from flask import session as flask_session, redirect, url_for
     oauth_enabled = bool(os.environ.get("GOOGLE_CLIENT_ID"))
     if oauth_enabled and 'user_email' not in flask_session:
         return redirect(url_for('login'))
 
+
+# Largest request body the content API accepts. The biggest legitimate one is a
+# /generate call carrying Ordino's candidate fields, well under this.
+_MAX_POST_BYTES = 64 * 1024
+
+
+def _too_large():
+    return jsonify({"success": False, "error": "Request body too large"}), 413
+
+
+@content_bp.before_request
+def limit_body_size():
+    """Reject oversized request bodies before anything reads or parses them."""
+    if request.content_length and request.content_length > _MAX_POST_BYTES:
+        return _too_large()
+    # Chunked bodies declare no length (and werkzeug truncates rather than rejects
+    # them at max_content_length): read up to one byte past the cap here, then
+    # hand the routes what was read.
+    if request.content_length is None and request.environ.get("wsgi.input_terminated"):
+        body = request.environ["wsgi.input"].read(_MAX_POST_BYTES + 1)
+        if len(body) > _MAX_POST_BYTES:
+            return _too_large()
+        request.environ["wsgi.input"] = io.BytesIO(body)
+
 # Full template with sidebar (inline, no imports needed)
 CONTENT_INTELLIGENCE_HTML = '''<!DOCTYPE html>
 <html>
@@ -39,7 +122,9 @@ CONTENT_INTELLIGENCE_HTML = '''<!DOCTYPE html>
     <title>Beacon - Content Intelligence</title>
     <link rel="preconnect" href="https://fonts.googleapis.com">
     <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500;600;700&display=swap" rel="stylesheet">
+    <!-- Web fonts are non-critical (system-ui fallbacks): load their CSS without blocking first paint. -->
+    <link rel="preload" as="style" href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500;600;700&display=swap" onload="this.onload=null;this.rel='stylesheet'">
+    <noscript><link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500;600;700&display=swap" rel="stylesheet"></noscript>
     <style>
         * { margin: 0; padding: 0; box-sizing: border-box; }
 
@@ -361,6 +446,7 @@ CONTENT_INTELLIGENCE_HTML = '''<!DOCTYPE html>
         </div>
     </main>
     
+    <script id="candidates-data" type="application/json">__CANDIDATES_JSON__</script>
     <script>
         function toggleSidebar() {
             document.getElementById('sidebar').classList.toggle('collapsed');
@@ -384,8 +470,12 @@ CONTENT_INTELLIGENCE_HTML = '''<!DOCTYPE html>
         
         async function loadCandidates() {
             try {
-                const response = await fetch('/api/content/candidates');
-                const data = await response.json();
+                // First paint uses the list embedded in the page; fetch if it's missing.
+                const embedded = document.getElementById('candidates-data');
+                const data = embedded && embedded.textContent
+                    ? JSON.parse(embedded.textContent)
+                    : await (await fetch('/api/content/candidates')).json();
+                if (embedded) embedded.remove();
                 
                 if (data.success && data.candidates.length > 0) {
                     document.getElementById('pipeline-count').textContent = data.candidates.length;
@@ -409,8 +499,8 @@ CONTENT_INTELLIGENCE_HTML = '''<!DOCTYPE html>
                             </div>
                             ${c.review_question ? `<div style="background: #fef3c7; padding: 12px; border-radius: 8px; margin: 12px 0; font-size: 13px;"><strong>Review Question:</strong> ${c.review_question}</div>` : ''}
                             <div style="margin-top: 16px;">
-                                <button class="btn btn-primary" onclick="generateContent(${c.id}, 'blog_post')">Generate</button>
-                                ${c.source_url !== 'internal_analysis' ? '<button class="btn btn-outline" onclick="viewSource(\''+c.source_url+'\')">🔗 Source</button>' : ''}
+                                <button class="btn btn-primary" onclick="generateContent('${c.id}', 'blog_post')">Generate</button>
+                                ${c.source_url !== 'internal_analysis' ? '<button class="btn btn-outline" onclick="viewSource(\\''+c.source_url+'\\')">🔗 Source</button>' : ''}
                             </div>
                         `;
                         container.appendChild(card);
@@ -460,10 +550,21 @@ CONTENT_INTELLIGENCE_HTML = '''<!DOCTYPE html>
         btn.textContent = '⏳ Analyzing questions...';
         
         try {
-            const response = await fetch('/api/content/auto-generate', {method: 'POST'});
-            const data = await response.json();
+            let response = await fetch('/api/content/auto-generate', {method: 'POST'});
+            let data = await response.json();
+            // Long runs continue in the background; poll until they finish.
+            while (response.status === 202) {
+                await new Promise(resolve => setTimeout(resolve, 1500));
+                response = await fetch(data.poll_url);
+                data = await response.json();
+            }
             
-            if (data.success && data.candidates_created > 0) {
+            if (response.status === 404) {
+                // Lost track of the job, not a failure: it may still be running.
+                alert('Auto-generate is still running in the background. Refresh in a minute to see new ideas.');
+                btn.disabled = false;
+                btn.textContent = '🤖 Auto-Generate Content Ideas';
+            } else if (data.success && data.candidates_created > 0) {
                 alert(`Created ${data.candidates_created} content opportunities!`);
                 window.location.reload();
             } else {
@@ -483,28 +584,71 @@ CONTENT_INTELLIGENCE_HTML = '''<!DOCTYPE html>
 </html>'''
 
 
+# The page is fixed bytes around the embedded candidate list (the same payload
+# as /api/content/candidates), so first paint needs no second request.
+# Indentation and blank lines are stripped once at import (about a quarter of the
+# raw bytes). Line breaks stay, so inline JS keeps its statement boundaries; the
+# page has no <pre> or whitespace-sensitive text.
+_DASHBOARD_HEAD, _DASHBOARD_TAIL = '\n'.join(
+    line.strip() for line in CONTENT_INTELLIGENCE_HTML.splitlines() if line.strip()
+).encode('utf-8').split(b'__CANDIDATES_JSON__')
+
+# (etag, gzipped page) for the last page served. The page only changes when the
+# candidate list does, so most loads reuse the compressed bytes.
+_dashboard_gzip: tuple = (None, b'')
+
+
 @content_bp.route('/content-intelligence')
 def dashboard():
     """Content Intelligence dashboard with inline sidebar"""
-    return render_template_string(CONTENT_INTELLIGENCE_HTML)
+    try:
+        candidates = _json_bytes({
+            "success": True,
+            "candidates": get_engine().get_pending_candidates_raw(),
+        })
+        # '<' only occurs inside JSON strings; escaping it keeps a title
+        # containing "</script>" from closing the data block.
+        candidates = candidates.replace(b'<', b'\\u003c')
+    except Exception as e:
+        logger.error(f"Dashboard candidate embed failed: {e}")
+        candidates = b''  # the page falls back to fetching the list
+    global _dashboard_gzip
+    page = _DASHBOARD_HEAD + candidates + _DASHBOARD_TAIL
+    # The ETag tracks the embedded list, so an unchanged page is a 304.
+    etag = hashlib.sha1(page).hexdigest()
+    response = Response(page, mimetype='text/html')
+    if request.accept_encodings['gzip'] > 0:
+        # ~20 KB of inline CSS/JS compresses ~5x.
+        etag += '-gz'
+        cached_etag, compressed = _dashboard_gzip
+        if cached_etag != etag:
+            compressed = gzip.compress(page, compresslevel=9)
+            _dashboard_gzip = (etag, compressed)
+        response.set_data(compressed)
+        response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    response.set_etag(etag)
+    # private: the page sits behind login, so shared caches must not keep it.
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
 
 
 # Keep all API endpoints unchanged
 @content_bp.route('/api/content/candidates', methods=['GET'])
 def get_candidates():
     try:
+        engine = get_engine()
         priority = request.args.get('priority')
-        candidates = engine.get_pending_candidates(priority=priority)
-        return jsonify({
+        response = _json_response({
             "success": True,
-            "candidates": [{
-                "id": c.id, "title": c.title, "content_type": c.content_type,
-                "priority": c.priority, "relevance_score": c.relevance_score,
-                "search_interest": c.search_interest, "reasoning": c.reasoning,
-                "review_question": c.review_question, "team_questions_count": c.team_questions_count,
-                "source_url": c.source_url
-            } for c in candidates]
+            "candidates": engine.get_pending_candidates_raw(priority=priority),
         })
+        # Pollers that already have this list get a 304 and no body.
+        response.add_etag()
+        response.cache_control.private = True
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -512,7 +656,8 @@ def get_candidates():
 @content_bp.route('/api/content/generate', methods=['POST'])
 def generate_content():
     try:
-        data = request.json
+        engine = get_engine()
+        data = _request_json()
         candidate_id = data.get('candidate_id')
         content_type = data.get('content_type', 'blog_post')
         if not candidate_id:
@@ -523,7 +668,6 @@ def generate_content():
         # local SQLite store (which won't have Ordino/Supabase-created candidates).
         candidate = None
         if data.get('title'):
-            from content_engine.engine import ContentCandidate
             candidate = ContentCandidate(
                 id=candidate_id,
                 title=data['title'],
@@ -545,41 +689,149 @@ def generate_content():
         # Surface the grounding gate so Ordino can flag drafts with unsourced facts
         # (fees/dollar amounts/code citations) before publish.
         grounding = getattr(engine, "_last_grounding", None)
-        return jsonify({"success": True, "content": content,
-                        "word_count": len(content.split()), "grounding": grounding})
+        word_count = getattr(engine, "_last_word_count", None) or len(content.split())
+        return _json_response({"success": True, "content": content,
+                               "word_count": word_count, "grounding": grounding})
     except Exception as e:
-        traceback.print_exc()
+        logger.exception("Content generation failed")
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+@content_bp.route('/api/content/generate-batch', methods=['POST'])
+def generate_content_batch():
+    """Generate drafts for several stored candidates in one request.
+
+    Body: {candidate_ids: [...], content_type: 'blog_post' | 'newsletter'}.
+    The drafts are generated concurrently; each result carries either the
+    content or that candidate's error.
+    """
+    try:
+        engine = get_engine()
+        data = _request_json()
+        candidate_ids = data.get('candidate_ids') or []
+        content_type = data.get('content_type', 'blog_post')
+        if not isinstance(candidate_ids, list) or not candidate_ids:
+            return jsonify({"success": False, "error": "Missing candidate_ids"}), 400
+
+        results = engine.generate_drafts(candidate_ids, content_type=content_type)
+        return _json_response({"success": True, "results": results})
+    except Exception as e:
+        logger.exception("Batch content generation failed")
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
+# /decide decision -> candidate status.
+_DECISION_STATUS = {'skip': 'skipped', 'publish': 'published',
+                    'approve': 'approved', 'draft': 'drafted'}
+
+
 @content_bp.route('/api/content/decide', methods=['POST'])
 def decide():
     try:
-        data = request.json
+        engine = get_engine()
+        data = _request_json()
         candidate_id = data.get('candidate_id')
         decision = data.get('decision')
-        status_map = {'skip': 'skipped', 'publish': 'published',
-                      'approve': 'approved', 'draft': 'drafted'}
-        new_status = status_map.get(decision)
+        if not candidate_id:
+            return jsonify({"success": False, "error": "Missing candidate_id"}), 400
+        new_status = _DECISION_STATUS.get(decision)
         if not new_status:
             return jsonify({"success": False, "error": f"unknown decision '{decision}'"}), 400
 
         # Supabase-first (the store Ordino reads), SQLite fallback — mirrors how
         # candidates are saved, so a skip/publish actually sticks instead of
         # updating a SQLite row Ordino never sees.
-        if engine.use_supabase:
-            engine.analytics_db.update_content_candidate(candidate_id, status=new_status)
-        else:
-            import sqlite3
-            conn = sqlite3.connect(engine.db_path)
-            c = conn.cursor()
-            c.execute("UPDATE content_candidates SET status = ? WHERE id = ?", (new_status, candidate_id))
-            conn.commit()
-            conn.close()
+        engine.set_candidate_status(candidate_id, new_status)
         return jsonify({"success": True, "status": new_status})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
+
+@content_bp.route('/api/content/decide-batch', methods=['POST'])
+def decide_batch():
+    """Apply several decisions at once.
+
+    Body: {decisions: [{candidate_id, decision}, ...]}. All are validated
+    before any is applied; locally they commit in one transaction.
+    """
+    try:
+        engine = get_engine()
+        decisions = _request_json().get('decisions') or []
+        if not isinstance(decisions, list) or not decisions:
+            return jsonify({"success": False, "error": "Missing decisions"}), 400
+        updates = []
+        for d in decisions:
+            if not isinstance(d, dict):
+                return jsonify({"success": False, "error": f"invalid decision {d!r}"}), 400
+            new_status = _DECISION_STATUS.get(d.get('decision'))
+            if not new_status or not d.get('candidate_id'):
+                return jsonify({"success": False,
+                                "error": f"invalid decision {d!r}"}), 400
+            updates.append((d['candidate_id'], new_status))
+
+        engine.set_candidate_statuses(updates)
+        return jsonify({"success": True, "updated": len(updates)})
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+# Auto-generate topic buckets (matches analytics.py logic): the first topic with
+# a keyword in the lowercased question wins, else "General".
+_AUTO_GEN_TOPICS = {
+    "Zoning": ["zoning", "use group", "far", "setback", "variance", "zr", "contextual"],
+    "DOB": ["dob", "permit", "filing", "alt1", "alt2", "nb", "dm", "paa", "objection"],
+    "DHCR": ["dhcr", "rent", "stabiliz", "mci", "iai", "lease", "rent increase"],
+    "Violations": ["violation", "ecb", "bis", "hpd violation", "dob violation"],
+    "Certificate of Occupancy": ["co", "certificate of occupancy", "tco", "temporary co"],
+    "Building Code": ["building code", "egress", "fire", "occupancy group", "sprinkler"],
+    "MDL": ["mdl", "multiple dwelling", "class a", "class b"],
+    "Plans": ["plan", "drawing", "elevation", "floor plan", "blueprint"],
+    "COMMAND": ["/correct", "/tip", "/feedback", "/help"],
+}
+
+# Example questions kept per topic for a candidate.
+_TOPIC_SAMPLE = 5
+
+# The same first-match bucketing as a SQL CASE over q = lower(question), so the
+# SQLite fallback groups questions in SQLite instead of returning every row.
+_TOPIC_CASE_SQL = "CASE {} ELSE 'General' END".format(" ".join(
+    "WHEN {} THEN ?".format(" OR ".join(["instr(q, ?) > 0"] * len(keywords)))
+    for keywords in _AUTO_GEN_TOPICS.values()
+))
+_TOPIC_CASE_PARAMS = tuple(
+    p for topic, keywords in _AUTO_GEN_TOPICS.items() for p in (*keywords, topic)
+)
+# Per topic: its question count and first _TOPIC_SAMPLE questions, in id order.
+_TOPIC_GROUPS_SQL = f"""
+    WITH tagged AS (
+        SELECT id, question, {_TOPIC_CASE_SQL} AS topic
+        FROM (SELECT id, question, lower(question) AS q
+              FROM interactions WHERE question IS NOT NULL)
+    ), ranked AS (
+        SELECT topic, question,
+               COUNT(*) OVER (PARTITION BY topic) AS n,
+               ROW_NUMBER() OVER (PARTITION BY topic ORDER BY id) AS rn
+        FROM tagged
+    )
+    SELECT topic, n, question FROM ranked WHERE rn <= {_TOPIC_SAMPLE} ORDER BY topic, rn
+"""
+
+
+# One alternation per topic, so each topic is a single regex search.
+_TOPIC_PATTERNS = [
+    (topic, re.compile("|".join(map(re.escape, keywords))))
+    for topic, keywords in _AUTO_GEN_TOPICS.items()
+]
+
+
+def _detect_topic(text: str) -> str:
+    """Auto-generate topic for one question (see _AUTO_GEN_TOPICS)."""
+    text_lower = text.lower()
+    for topic, pattern in _TOPIC_PATTERNS:
+        if pattern.search(text_lower):
+            return topic
+    return "General"
+
+
 def run_auto_generate(engine_obj=None):
     """Generate content candidates from analytics questions.
 
@@ -588,45 +840,21 @@ def run_auto_generate(engine_obj=None):
     candidates. Returns a plain dict (no Flask objects) so both the HTTP route
     and the background ContentScheduler can call it.
     """
-    eng = engine_obj or engine
+    eng = engine_obj or get_engine()
     try:
-        import sqlite3
-
-        # Topic detection (matches analytics.py logic)
-        def detect_topic(text):
-            text_lower = text.lower()
-            topic_map = {
-                "Zoning": ["zoning", "use group", "far", "setback", "variance", "zr", "contextual"],
-                "DOB": ["dob", "permit", "filing", "alt1", "alt2", "nb", "dm", "paa", "objection"],
-                "DHCR": ["dhcr", "rent", "stabiliz", "mci", "iai", "lease", "rent increase"],
-                "Violations": ["violation", "ecb", "bis", "hpd violation", "dob violation"],
-                "Certificate of Occupancy": ["co", "certificate of occupancy", "tco", "temporary co"],
-                "Building Code": ["building code", "egress", "fire", "occupancy group", "sprinkler"],
-                "MDL": ["mdl", "multiple dwelling", "class a", "class b"],
-                "Plans": ["plan", "drawing", "elevation", "floor plan", "blueprint"],
-                "COMMAND": ["/correct", "/tip", "/feedback", "/help"],
-            }
-            for topic, keywords in topic_map.items():
-                if any(kw in text_lower for kw in keywords):
-                    return topic
-            return "General"
-
-        import json
-        import uuid
-        import os
-        from collections import defaultdict
-
         # ----- Pull questions from best available source -----
         all_question_texts = []
         source_used = "none"
+        # topic -> number of questions, and its first _TOPIC_SAMPLE questions
+        topic_counts = {}
+        topic_questions = defaultdict(list)
 
         # Try 1: Supabase edge function
         supabase_url = os.getenv("SUPABASE_URL", "")
         analytics_key = os.getenv("BEACON_ANALYTICS_KEY", "")
         if supabase_url and analytics_key:
             try:
-                import requests as req
-                resp = req.post(
+                resp = requests.post(
                     f"{supabase_url.rstrip('/')}/functions/v1/beacon-analytics",
                     json={"action": "get_recent_conversations", "data": {"limit": 200}},
                     headers={
@@ -646,19 +874,26 @@ def run_auto_generate(engine_obj=None):
                     ]
                     source_used = "supabase"
                     logger.info(f"[Content Auto-Gen] Pulled {len(all_question_texts)} questions from Supabase")
+                    for question in all_question_texts:
+                        topic = _detect_topic(question)
+                        topic_counts[topic] = topic_counts.get(topic, 0) + 1
+                        if len(topic_questions[topic]) < _TOPIC_SAMPLE:
+                            topic_questions[topic].append(question)
             except Exception as e:
                 logger.warning(f"[Content Auto-Gen] Supabase fetch failed, trying SQLite: {e}")
 
-        # Try 2: Local SQLite fallback
+        # Try 2: Local SQLite fallback, grouped by topic inside SQLite
         if not all_question_texts:
             try:
-                conn = sqlite3.connect('beacon_analytics.db')
-                c = conn.cursor()
-                c.execute("SELECT question FROM interactions WHERE question IS NOT NULL")
-                all_question_texts = [row[0] for row in c.fetchall()]
-                conn.close()
-                source_used = "sqlite"
-                logger.info(f"[Content Auto-Gen] Pulled {len(all_question_texts)} questions from SQLite")
+                rows = eng.query_analytics(_TOPIC_GROUPS_SQL, _TOPIC_CASE_PARAMS)
+                if rows is not None:
+                    for topic, count, question in rows:
+                        topic_counts[topic] = count
+                        topic_questions[topic].append(question)
+                    all_question_texts = [q for qs in topic_questions.values() for q in qs]
+                    source_used = "sqlite"
+                    logger.info(f"[Content Auto-Gen] Pulled {sum(topic_counts.values())} "
+                                f"questions from SQLite")
             except Exception as e:
                 logger.warning(f"[Content Auto-Gen] SQLite fetch also failed: {e}")
 
@@ -672,24 +907,18 @@ def run_auto_generate(engine_obj=None):
                 "source": source_used,
             }
 
-        # ----- Group questions by detected topic -----
-        topic_questions = defaultdict(list)
-        for question in all_question_texts:
-            detected_topic = detect_topic(question)
-            topic_questions[detected_topic].append(question)
-
         # Filter to topics with 2+ questions (skip COMMAND)
         topic_groups = [
-            (topic, len(questions), questions[:5])
-            for topic, questions in topic_questions.items()
-            if len(questions) >= 2 and topic != "COMMAND"
+            (topic, count, topic_questions[topic])
+            for topic, count in topic_counts.items()
+            if count >= 2 and topic != "COMMAND"
         ]
         topic_groups.sort(key=lambda x: x[1], reverse=True)
 
         if not topic_groups:
             return {
                 "success": True,
-                "message": f"Found {len(all_question_texts)} questions but none have 2+ per topic yet.",
+                "message": f"Found {sum(topic_counts.values())} questions but none have 2+ per topic yet.",
                 "candidates_created": 0,
                 "candidates": [],
                 "created_ids": [],
@@ -700,21 +929,15 @@ def run_auto_generate(engine_obj=None):
         # Persist through the engine's Supabase-first save (SQLite fallback) so
         # candidates land in the same store Ordino reads — NOT just Beacon's local
         # SQLite, which Ordino never sees.
-        from content_engine.engine import ContentCandidate
-
         candidates_created = []
-        created_ids = []
+        new_candidates = []
 
         # Dedup: skip any topic that already has a pending candidate.
         try:
-            existing_pending = eng.get_pending_candidates()
+            existing_topics = eng.get_pending_topics()
         except Exception as e:
             logger.warning(f"[Content Auto-Gen] dedup load failed: {e}")
-            existing_pending = []
-        existing_topics = set()
-        for c in existing_pending:
-            for kt in (getattr(c, "key_topics", None) or []):
-                existing_topics.add(str(kt).lower())
+            existing_topics = set()
 
         for topic, count, questions in topic_groups:
             if topic.lower() in existing_topics:
@@ -734,14 +957,18 @@ def run_auto_generate(engine_obj=None):
             if not services:
                 services = ['General']
 
+            # Any timeline question wins; else any requirement question.
             angle = "Process guidance"
-            if any('how long' in q.lower() for q in questions):
-                angle = "Timeline concerns"
-            elif any('require' in q.lower() for q in questions):
-                angle = "Requirement clarification"
+            for q in questions:
+                q_lower = q.lower()
+                if 'how long' in q_lower:
+                    angle = "Timeline concerns"
+                    break
+                if 'require' in q_lower:
+                    angle = "Requirement clarification"
 
             candidate = ContentCandidate(
-                id=f"cand_{uuid.uuid4().hex[:12]}",
+                id=f"cand_{secrets.token_hex(6)}",
                 title=f"Guide to {topic} in NYC",
                 content_type=content_type,
                 priority=priority,
@@ -759,7 +986,7 @@ def run_auto_generate(engine_obj=None):
                 status="pending",
                 created_at=datetime.now().isoformat(),
             )
-            eng._save_candidate(candidate)
+            new_candidates.append(candidate)
             existing_topics.add(topic.lower())
 
             candidates_created.append({
@@ -767,27 +994,80 @@ def run_auto_generate(engine_obj=None):
                 "priority": priority,
                 "questions": count,
             })
-            created_ids.append(candidate.id)
+
+        # One bulk save (single Supabase call or SQLite transaction).
+        eng.save_candidates(new_candidates)
 
         return {
             "success": True,
             "candidates_created": len(candidates_created),
             "candidates": candidates_created,
-            "created_ids": created_ids,
+            "created_ids": [c.id for c in new_candidates],
             "source": source_used,
         }
 
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("Auto-generate failed")
         return {"success": False, "error": str(e)}
 
 
+# Auto-generate runs off the request thread. Job state lives in the engine's
+# local SQLite store (start_job/get_job), so any gunicorn worker can answer a
+# poll and only one run is in flight across workers.
+_auto_gen_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="content-autogen")
+# How long the POST waits for a quick run before answering 202 with a job id.
+_AUTO_GEN_INLINE_WAIT = 0.5
+# A job still "running" after this long died with its worker; it's superseded.
+_AUTO_GEN_STALE_SECONDS = 15 * 60
+
+
+def _run_auto_generate_job(eng: ContentEngine, job_id: str):
+    """Pool task: run auto-generate and record the result for pollers."""
+    result = run_auto_generate(eng)
+    try:
+        eng.finish_job(job_id, result)
+    except Exception:
+        logger.exception("Recording auto-generate job %s failed", job_id)
+
+
+def _auto_gen_response(job_id: str):
+    """The finished run's result, or 202 with the job id to poll."""
+    job = get_engine().get_job(job_id)
+    if job is None:
+        return jsonify({"success": False, "error": "Unknown job"}), 404
+    if job["status"] == "running":
+        if time.time() - job["started_at"] > _AUTO_GEN_STALE_SECONDS:
+            return jsonify({"success": False, "error": "Auto-generate job did not finish"}), 500
+        return jsonify({
+            "success": True,
+            "job_id": job_id,
+            "status": "running",
+            "poll_url": url_for('content.auto_generate_status', job_id=job_id),
+        }), 202
+    result = job["result"]
+    return jsonify(result), (200 if result.get("success") else 500)
+
+
 @content_bp.route('/api/content/auto-generate', methods=['POST'])
 def auto_generate_candidates():
-    """HTTP wrapper around run_auto_generate()."""
-    result = run_auto_generate()
-    return jsonify(result), (200 if result.get("success") else 500)
+    """Start run_auto_generate() in the background (joining a run that's
+    already in flight). Answers with the result if it finishes quickly,
+    else 202 with a job_id for /api/content/auto-generate/<job_id>."""
+    eng = get_engine()
+    job_id, started = eng.start_job("auto_generate", _AUTO_GEN_STALE_SECONDS)
+    if started:
+        future = _auto_gen_pool.submit(_run_auto_generate_job, eng, job_id)
+        try:
+            future.result(timeout=_AUTO_GEN_INLINE_WAIT)
+        except FutureTimeout:
+            pass
+    return _auto_gen_response(job_id)
+
+
+@content_bp.route('/api/content/auto-generate/<job_id>', methods=['GET'])
+def auto_generate_status(job_id):
+    """Poll a background auto-generate run."""
+    return _auto_gen_response(job_id)
 
 
 @content_bp.route('/api/content/analyze-opportunities', methods=['POST'])
@@ -800,7 +1080,7 @@ def analyze_opportunities():
         }), 503
     
     try:
-        data = request.get_json() or {}
+        data = _request_json()
         days_back = data.get('days_back', 30)
         min_questions = data.get('min_questions', 2)
         
@@ -845,9 +1125,7 @@ def analyze_opportunities():
         })
         
     except Exception as e:
-        logger.error(f"Error in analyze_opportunities: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in analyze_opportunities")
         return jsonify({
             "success": False,
             "error": str(e)
@@ -514,7 +514,8 @@ def initialize_app() -> None:
 
             if _have_sched_lock:
                 try:
-                    from analytics.content_routes import engine as _content_engine
+                    from analytics.content_routes import get_engine
+                    _content_engine = get_engine()
                 except Exception as _e:
                     _content_engine = None
                     logger.warning(f"Content scheduler: could not import content engine: {_e}")
@@ -7,23 +7,68 @@ to generate content opportunities and drafts.
 Uses Supabase (via edge function) for persistence, with SQLite fallback.
 """
 
+import copy
+import functools
+import hashlib
 import json
+import re
 import sqlite3
 import logging
+import operator
 import os
-import uuid
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import List, Dict, Optional
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Optional, Tuple
+from dataclasses import dataclass
+
+import requests
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from core.llm_client import ClaudeClient
 from core.retriever import Retriever
 from .parser import DOBNewsletterParser
+from .prompts import (
+    ANALYSIS_PROMPT, ANALYSIS_TOOL, BLOG_POST_PROMPT, LOW_COVERAGE_LINE, NEWSLETTER_PROMPT,
+    SUMMARIZE_EMAIL_PROMPT,
+)
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# JSON for the list columns of candidate rows: orjson when installed, else stdlib.
+if HAS_ORJSON:
+    def _json_dumps(value) -> str:
+        return orjson.dumps(value).decode()
+    _json_loads = orjson.loads
+else:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+# Keyword extraction for the team-question lookup: 5+ letter words only, minus
+# English filler and words every DOB notice contains (they match everything).
+_KEYWORD_RE = re.compile(r"[a-z]{5,}")
+_KEYWORD_STOPWORDS = frozenset({
+    "about", "above", "after", "again", "along", "among", "being", "below",
+    "could", "doesn", "during", "every", "first", "might", "other", "shall",
+    "should", "since", "still", "their", "there", "these", "thing", "those",
+    "through", "under", "until", "where", "which", "while", "whose", "would",
+    "please", "today", "within", "without",
+    # DOB newsletter boilerplate
+    "building", "buildings", "department", "notice", "update", "updates",
+    "service", "effective", "information",
+})
+
+
+@dataclass(slots=True)
 class ContentCandidate:
     """Content recommendation"""
     id: str
@@ -56,6 +101,128 @@ class ContentCandidate:
     created_at: str = ""
 
 
+# Column list for content_candidates, in table order. Selected explicitly (not
+# SELECT *) so rows can be read by name through sqlite3.Row.
+_CANDIDATE_COLUMNS = (
+    "id", "title", "content_type", "priority", "relevance_score", "demand_score",
+    "expertise_score", "search_interest", "affects_services", "key_topics",
+    "reasoning", "review_question", "content_angle", "team_questions_count",
+    "team_questions", "most_common_angle", "source_type", "source_url",
+    "source_email_id", "content_preview", "recommended_format",
+    "estimated_minutes", "status", "created_at",
+)
+_CANDIDATE_SELECT = f"SELECT {', '.join(_CANDIDATE_COLUMNS)} FROM content_candidates"
+_CANDIDATE_INSERT = (
+    f"INSERT OR REPLACE INTO content_candidates ({', '.join(_CANDIDATE_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_CANDIDATE_COLUMNS))})"
+)
+# Reads every column's attribute off a candidate in one call, in column order.
+_CANDIDATE_GET = operator.attrgetter(*_CANDIDATE_COLUMNS)
+# List-valued columns: sent to Supabase as lists, stored in SQLite as JSON text.
+_CANDIDATE_LIST_COLUMNS = ("affects_services", "key_topics", "team_questions")
+_CANDIDATE_JSON_IDX = tuple(_CANDIDATE_COLUMNS.index(col) for col in _CANDIDATE_LIST_COLUMNS)
+# Values for required fields missing from a Supabase row; the optional fields
+# fall back to the dataclass defaults.
+_CANDIDATE_ROW_DEFAULTS = {
+    "id": "", "title": "", "content_type": "blog_post", "priority": "medium",
+    "relevance_score": 50,
+}
+
+# Fields of the dashboard candidate list.
+_CANDIDATE_SUMMARY_COLUMNS = (
+    "id", "title", "content_type", "priority", "relevance_score", "search_interest",
+    "reasoning", "review_question", "team_questions_count", "source_url",
+)
+# NULL stand-ins, applied in SQL (COALESCE) for SQLite and per key for Supabase.
+_CANDIDATE_SUMMARY_NULLS = {"search_interest": "unknown", "reasoning": "",
+                            "team_questions_count": 0}
+_CANDIDATE_SUMMARY_DEFAULTS = {**_CANDIDATE_ROW_DEFAULTS, **_CANDIDATE_SUMMARY_NULLS}
+_CANDIDATE_SUMMARY_SELECT = "SELECT {} FROM content_candidates".format(", ".join(
+    f"COALESCE({col}, {_CANDIDATE_SUMMARY_NULLS[col]!r}) AS {col}"
+    if col in _CANDIDATE_SUMMARY_NULLS else col
+    for col in _CANDIDATE_SUMMARY_COLUMNS
+))
+
+# Dashboard read paths (candidates, drafts, stats) are cached this long.
+_READ_CACHE_TTL = 15  # seconds
+
+# After a failed Supabase backend load, wait this long before trying again.
+_SUPABASE_RETRY_SECONDS = 60
+
+# Local analytics store (written by analytics.AnalyticsDB), used as the
+# team-question fallback when Supabase is unavailable.
+_ANALYTICS_DB_PATH = "beacon_analytics.db"
+
+# Keyword match against the local analytics interactions. Only the number of
+# LIKE placeholders varies (1-5 keywords), so sqlite3's statement cache reuses it.
+_TEAM_QUESTIONS_SQL = """
+    SELECT question, user_name
+    FROM interactions
+    WHERE ({where})
+    AND timestamp > datetime('now', ?)
+    LIMIT 10
+"""
+
+# Same lookup through the interactions_fts index (created by BeaconAnalytics),
+# prefix-matching each keyword.
+_TEAM_QUESTIONS_FTS_SQL = """
+    SELECT i.question, i.user_name
+    FROM interactions_fts
+    JOIN interactions i ON i.id = interactions_fts.rowid
+    WHERE interactions_fts MATCH ?
+    AND i.timestamp > datetime('now', ?)
+    LIMIT 10
+"""
+
+# Draft-generation retrieval cache: regenerating a draft re-issues the same KB query,
+# so keep recent results briefly. The TTL keeps newly ingested docs from being
+# masked for long.
+_RETRIEVAL_CACHE_SIZE = 256
+_RETRIEVAL_CACHE_TTL = 900  # seconds
+
+# Team-question lookups: items in one newsletter often share a keyword set, so
+# reuse the result for an hour instead of re-querying and re-embedding.
+_TEAM_QUESTIONS_CACHE_TTL = 3600  # seconds
+
+
+def _ttl_cached(method):
+    """Cache a read method's result per (method, args) for _READ_CACHE_TTL seconds.
+
+    Dashboards poll these every few seconds; a burst of reads shares one upstream
+    call. Returns a shallow copy so callers can't mutate the cached value. Write
+    methods invalidate it before and after the write (_invalidates_reads).
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        with self._read_cache_lock:
+            hit = self._read_cache.get(key)
+            generation = self._read_cache_generation
+        if hit and now - hit[0] < _READ_CACHE_TTL:
+            return copy.copy(hit[1])
+        value = method(self, *args, **kwargs)
+        with self._read_cache_lock:
+            # Don't store a result that raced with a write.
+            if generation == self._read_cache_generation:
+                self._read_cache[key] = (now, value)
+        return copy.copy(value)
+    return wrapper
+
+
+def _invalidates_reads(method):
+    """Mark a write method: cached reads are dropped when it starts and again when
+    it finishes (even if it raises), so a read served mid-write isn't kept."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.invalidate_read_cache()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.invalidate_read_cache()
+    return wrapper
+
+
 class ContentEngine:
     """Main content intelligence engine.
 
@@ -72,12 +239,67 @@ class ContentEngine:
         self.retriever = Retriever()
         self.parser = DOBNewsletterParser()
         self._analytics_db = None
+        self._supabase_failed_at: Optional[float] = None
+        self._read_cache: Dict[tuple, tuple] = {}
+        self._read_cache_lock = threading.Lock()
+        self._read_cache_generation = 0
+        self._retrieval_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._retrieval_cache_lock = threading.Lock()
+        self._team_q_cache: Dict[tuple, tuple] = {}
+        self._team_q_cache_lock = threading.Lock()
+        self._analytics_sqlite_exists = False
+        # One persistent SQLite connection per engine (Flask worker threads and the
+        # scheduler share it), serialized by _sqlite_lock.
+        self._sqlite: Optional[sqlite3.Connection] = None
+        self._sqlite_lock = threading.Lock()
+        # Same for reads from the bot's local analytics DB (team questions,
+        # auto-generate), serialized by _analytics_sqlite_lock.
+        self._analytics_sqlite: Optional[sqlite3.Connection] = None
+        self._analytics_sqlite_lock = threading.Lock()
+        # Keep-alive connections for the beacon-analytics edge function, with its
+        # auth headers set once.
+        self._http = requests.Session()
+        self._http.headers.update({
+            "Content-Type": "application/json",
+            "x-beacon-key": os.getenv("BEACON_ANALYTICS_KEY", ""),
+        })
+        # Generated drafts are saved in the background so callers get the content
+        # back without waiting on the write. flush() waits for pending saves.
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="content-save")
+        self._pending_saves: set = set()
+        self._pending_saves_lock = threading.Lock()
+        # Per-thread results of the last generate_* call (read back by the
+        # /generate route); threaded workers run several generations at once.
+        self._last = threading.local()
         self._init_sqlite_fallback()
 
+    @property
+    def _last_word_count(self) -> Optional[int]:
+        return getattr(self._last, "word_count", None)
+
+    @_last_word_count.setter
+    def _last_word_count(self, value: int):
+        self._last.word_count = value
+
+    @property
+    def _last_grounding(self) -> Optional[dict]:
+        return getattr(self._last, "grounding", None)
+
+    @_last_grounding.setter
+    def _last_grounding(self, value: dict):
+        self._last.grounding = value
+
     @property
     def analytics_db(self):
-        """Lazy-load the Supabase analytics backend."""
+        """Lazy-load the Supabase analytics backend.
+
+        A failed load is remembered for _SUPABASE_RETRY_SECONDS, so the save/read
+        paths don't re-import and re-init the backend on every call meanwhile.
+        """
         if self._analytics_db is None:
+            if (self._supabase_failed_at is not None
+                    and time.monotonic() - self._supabase_failed_at < _SUPABASE_RETRY_SECONDS):
+                return None
             try:
                 from analytics.analytics_supabase import SupabaseAnalyticsDB
                 from config import Settings as _Settings
@@ -85,8 +307,10 @@ class ContentEngine:
                 self._analytics_db = SupabaseAnalyticsDB(
                     _s.supabase_url, os.getenv("BEACON_ANALYTICS_KEY", "")
                 )
+                self._supabase_failed_at = None
                 logger.info("Content engine using Supabase backend")
             except Exception as e:
+                self._supabase_failed_at = time.monotonic()
                 logger.warning(f"Supabase not available, using SQLite: {e}")
         return self._analytics_db
 
@@ -97,57 +321,203 @@ class ContentEngine:
     def _init_sqlite_fallback(self):
         """Initialize SQLite as fallback (for local dev or when Supabase is down)."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            c = conn.cursor()
-            c.execute("""
-                CREATE TABLE IF NOT EXISTS content_candidates (
-                    id TEXT PRIMARY KEY,
-                    title TEXT,
-                    content_type TEXT,
-                    priority TEXT,
-                    relevance_score INTEGER,
-                    demand_score INTEGER,
-                    expertise_score INTEGER,
-                    search_interest TEXT,
-                    affects_services TEXT,
-                    key_topics TEXT,
-                    reasoning TEXT,
-                    review_question TEXT,
-                    content_angle TEXT,
-                    team_questions_count INTEGER,
-                    team_questions TEXT,
-                    most_common_angle TEXT,
-                    source_type TEXT DEFAULT 'question_cluster',
-                    source_url TEXT,
-                    source_email_id TEXT,
-                    content_preview TEXT,
-                    recommended_format TEXT,
-                    estimated_minutes INTEGER,
-                    status TEXT,
-                    created_at TEXT
-                )
-            """)
-            c.execute("""
-                CREATE TABLE IF NOT EXISTS generated_content (
-                    id TEXT PRIMARY KEY,
-                    candidate_id TEXT,
-                    content_type TEXT,
-                    title TEXT,
-                    content TEXT,
-                    word_count INTEGER,
-                    status TEXT DEFAULT 'draft',
-                    generated_at TEXT,
-                    approved_by TEXT,
-                    approved_at TEXT,
-                    published_at TEXT,
-                    published_url TEXT
-                )
-            """)
-            conn.commit()
-            conn.close()
+            with self._sqlite_cursor() as c:
+                self._create_sqlite_schema(c)
         except Exception as e:
             logger.warning(f"SQLite init failed: {e}")
 
+    def _create_sqlite_schema(self, c: sqlite3.Cursor):
+        """Create (or migrate) the fallback tables and indexes."""
+        c.execute("""
+            CREATE TABLE IF NOT EXISTS content_candidates (
+                id TEXT PRIMARY KEY,
+                title TEXT,
+                content_type TEXT,
+                priority TEXT,
+                relevance_score INTEGER,
+                demand_score INTEGER,
+                expertise_score INTEGER,
+                search_interest TEXT,
+                affects_services TEXT,
+                key_topics TEXT,
+                reasoning TEXT,
+                review_question TEXT,
+                content_angle TEXT,
+                team_questions_count INTEGER,
+                team_questions TEXT,
+                most_common_angle TEXT,
+                source_type TEXT DEFAULT 'question_cluster',
+                source_url TEXT,
+                source_email_id TEXT,
+                content_preview TEXT,
+                recommended_format TEXT,
+                estimated_minutes INTEGER,
+                status TEXT,
+                created_at TEXT
+            )
+        """)
+        # Older local stores predate some columns; add any that are missing so
+        # the explicit column list in _CANDIDATE_SELECT always resolves.
+        existing = {r[1] for r in c.execute("PRAGMA table_info(content_candidates)")}
+        for col in _CANDIDATE_COLUMNS:
+            if col not in existing:
+                c.execute(f"ALTER TABLE content_candidates ADD COLUMN {col}")
+        # Pending-list queries filter on status (and optionally priority) and
+        # sort by relevance; these let SQLite walk the index instead of sorting.
+        c.execute("CREATE INDEX IF NOT EXISTS idx_cc_status_prio_score "
+                  "ON content_candidates(status, priority, relevance_score DESC)")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_cc_status_score "
+                  "ON content_candidates(status, relevance_score DESC)")
+        c.execute("""
+            CREATE TABLE IF NOT EXISTS generated_content (
+                id TEXT PRIMARY KEY,
+                candidate_id TEXT,
+                content_type TEXT,
+                title TEXT,
+                content TEXT,
+                word_count INTEGER,
+                status TEXT DEFAULT 'draft',
+                generated_at TEXT,
+                approved_by TEXT,
+                approved_at TEXT,
+                published_at TEXT,
+                published_url TEXT
+            )
+        """)
+        # Draft listings filter on status, newest first.
+        c.execute("CREATE INDEX IF NOT EXISTS idx_gc_status_generated "
+                  "ON generated_content(status, generated_at DESC)")
+        # Background job state. Kept in the local store (never Supabase) so every
+        # gunicorn worker on the host sees the same jobs.
+        c.execute("""
+            CREATE TABLE IF NOT EXISTS content_jobs (
+                id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                status TEXT NOT NULL,
+                result TEXT,
+                started_at REAL NOT NULL,
+                finished_at REAL
+            )
+        """)
+        c.execute("CREATE INDEX IF NOT EXISTS idx_jobs_kind_status "
+                  "ON content_jobs(kind, status, started_at)")
+
+    @contextmanager
+    def _sqlite_cursor(self):
+        """Cursor on the engine's persistent SQLite connection, held under the lock.
+
+        Opens the connection on first use (WAL, synchronous=NORMAL). Commits when
+        the block exits cleanly, rolls back if it raises.
+        """
+        with self._sqlite_lock:
+            if self._sqlite is None:
+                conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                conn.row_factory = sqlite3.Row
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                self._sqlite = conn
+            cur = self._sqlite.cursor()
+            try:
+                yield cur
+                self._sqlite.commit()
+            except Exception:
+                self._sqlite.rollback()
+                raise
+            finally:
+                cur.close()
+
+    @contextmanager
+    def _analytics_cursor(self):
+        """Cursor on a persistent connection to the local analytics DB, held under
+        its lock. Read-only use; callers check _analytics_sqlite_available() first
+        (query_analytics does both for callers outside the engine)."""
+        with self._analytics_sqlite_lock:
+            if self._analytics_sqlite is None:
+                self._analytics_sqlite = sqlite3.connect(_ANALYTICS_DB_PATH,
+                                                         check_same_thread=False)
+            cur = self._analytics_sqlite.cursor()
+            try:
+                yield cur
+            finally:
+                cur.close()
+
+    def flush(self):
+        """Wait for background draft saves to finish."""
+        with self._pending_saves_lock:
+            pending = list(self._pending_saves)
+        wait(pending)
+
+    def close(self):
+        """Flush pending saves and close the persistent SQLite connections
+        (reopened on next use)."""
+        self.flush()
+        with self._sqlite_lock:
+            if self._sqlite is not None:
+                self._sqlite.close()
+                self._sqlite = None
+        with self._analytics_sqlite_lock:
+            if self._analytics_sqlite is not None:
+                self._analytics_sqlite.close()
+                self._analytics_sqlite = None
+
+    # ------------------------------------------------------------------
+    # Background jobs
+    # ------------------------------------------------------------------
+
+    def start_job(self, kind: str, stale_after: float) -> Tuple[str, bool]:
+        """Claim the single running job of this kind, across worker processes.
+
+        Returns (job_id, True) for a newly started job, or (job_id, False) when a
+        job of this kind started less than stale_after seconds ago is still
+        running — callers join that one instead.
+        """
+        job_id = secrets.token_hex(8)
+        now = time.time()
+        with self._sqlite_cursor() as c:
+            # One statement, so the check and the claim can't interleave with
+            # another worker's.
+            c.execute(
+                "INSERT INTO content_jobs (id, kind, status, started_at) "
+                "SELECT ?, ?, 'running', ? WHERE NOT EXISTS ("
+                "SELECT 1 FROM content_jobs WHERE kind = ? AND status = 'running' "
+                "AND started_at > ?)",
+                (job_id, kind, now, kind, now - stale_after),
+            )
+            if c.rowcount == 1:
+                return job_id, True
+            c.execute(
+                "SELECT id FROM content_jobs WHERE kind = ? AND status = 'running' "
+                "ORDER BY started_at DESC LIMIT 1",
+                (kind,),
+            )
+            return c.fetchone()["id"], False
+
+    def finish_job(self, job_id: str, result: dict):
+        """Record a job's result, and drop jobs finished over a day ago."""
+        now = time.time()
+        with self._sqlite_cursor() as c:
+            c.execute(
+                "UPDATE content_jobs SET status = 'done', result = ?, finished_at = ? "
+                "WHERE id = ?",
+                (_json_dumps(result), now, job_id),
+            )
+            c.execute("DELETE FROM content_jobs WHERE finished_at < ?", (now - 86400,))
+
+    def get_job(self, job_id: str) -> Optional[dict]:
+        """A job's status ("running" or "done"), started_at (epoch seconds) and
+        result (None while running), or None for an unknown job."""
+        with self._sqlite_cursor() as c:
+            c.execute("SELECT status, result, started_at FROM content_jobs WHERE id = ?",
+                      (job_id,))
+            row = c.fetchone()
+        if row is None:
+            return None
+        return {
+            "status": row["status"],
+            "started_at": row["started_at"],
+            "result": _json_loads(row["result"]) if row["result"] else None,
+        }
+
     # ------------------------------------------------------------------
     # Analyze & Create Candidates
     # ------------------------------------------------------------------
@@ -159,7 +529,7 @@ class ContentEngine:
         analysis = self._analyze_with_claude(title, summary, team_context)
 
         candidate = ContentCandidate(
-            id=f"cand_{uuid.uuid4().hex[:12]}",
+            id=f"cand_{secrets.token_hex(6)}",
             title=analysis.get("title", title),
             content_type=analysis.get("content_type", "uncertain"),
             priority=analysis.get("priority", "medium"),
@@ -174,7 +544,8 @@ class ContentEngine:
             content_angle=analysis.get("content_angle"),
             team_questions_count=team_context.get("count", 0),
             team_questions=team_context.get("questions", []),
-            most_common_angle=team_context.get("angle"),
+            most_common_angle=(analysis.get("most_common_angle")
+                               if team_context.get("questions") else None),
             source_type=source_type,
             source_url=source_url,
             content_preview=summary[:500],
@@ -187,6 +558,30 @@ class ContentEngine:
         self._save_candidate(candidate)
         return candidate
 
+    def analyze_updates(self, items: List[Dict],
+                        concurrency: Optional[int] = None) -> List[Optional[ContentCandidate]]:
+        """Analyze a batch of updates concurrently.
+
+        Each item is a dict of analyze_update() keyword arguments. Per-item Claude
+        round trips dominate, so items run on a thread pool of ``concurrency``
+        workers (default: BEACON_LLM_CONCURRENCY env var, else 4). Returns
+        candidates in input order; an item that fails is logged and comes back
+        as None so one bad update doesn't sink the batch.
+        """
+        if not items:
+            return []
+        workers = concurrency or int(os.getenv("BEACON_LLM_CONCURRENCY", "4"))
+
+        def _one(item: Dict) -> Optional[ContentCandidate]:
+            try:
+                return self.analyze_update(**item)
+            except Exception as e:
+                logger.error(f"analyze_updates: failed for '{item.get('title')}': {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(items)))) as pool:
+            return list(pool.map(_one, items))
+
     def analyze_email_thread(self, subject: str, body: str,
                               sender: str = "", email_id: str = None) -> ContentCandidate:
         """Analyze an email thread for content opportunities.
@@ -212,6 +607,7 @@ class ContentEngine:
                 self.analytics_db.update_content_candidate(
                     candidate.id, source_email_id=email_id
                 )
+                self.invalidate_read_cache()
 
         return candidate
 
@@ -219,17 +615,12 @@ class ContentEngine:
         """Use Claude to extract the content-worthy substance from an email."""
         from core.llm_client import Message
 
-        prompt = f"""Extract the key information from this email that could be turned into content for Green Light Expediting's blog or newsletter.
-
-From: {sender}
-Subject: {subject}
+        if not (body or "").strip():
+            return subject  # nothing to summarize — skip the Claude call
 
-{body[:3000]}
-
-Summarize in 2-3 paragraphs:
-1. What's the core topic/question/scenario?
-2. What expert knowledge or process is discussed?
-3. Why would GLE's clients find this valuable?"""
+        prompt = SUMMARIZE_EMAIL_PROMPT.substitute(
+            sender=sender, subject=subject, body=body[:3000]
+        )
 
         msg = Message(role="user", content=prompt)
         response_text, _, _ = self.claude.get_response(
@@ -260,70 +651,30 @@ Summarize in 2-3 paragraphs:
         query_parts = [candidate.title]
         query_parts += (candidate.key_topics or [])
         query_parts += (candidate.team_questions or [])[:3]
-        retrieval_query = " ".join(p for p in query_parts if p)
-        retrieval_result = self.retriever.retrieve(retrieval_query, top_k=8, min_score=0.6)
+        retrieval_result = self._retrieve_for_draft(" ".join(p for p in query_parts if p))
         context = retrieval_result.context
 
-        _low = set(t.lower() for t in (low_confidence_topics or []))
-        _topic_is_low = any(t.lower() in _low for t in (candidate.key_topics or []) + [candidate.title])
-        _low_line = ("- LOW knowledge-base coverage on this topic — bias HARD toward [[VERIFY]] "
-                     "for any specific figure; do not assert numbers." if _topic_is_low else "")
-
-        prompt = f"""Write a blog post for Green Light Expediting.
-
-Title: {candidate.title}
-
-Team has been asking about this {candidate.team_questions_count} times.
-{f"Most common concern: {candidate.most_common_angle}" if candidate.most_common_angle else ""}
-{f"Content angle: {candidate.content_angle}" if candidate.content_angle else ""}
-
-Sample questions they asked:
-{chr(10).join(f"- {q}" for q in (candidate.team_questions or [])[:5])}
-
-{f"Source: {candidate.source_type}" if candidate.source_type != "question_cluster" else ""}
-{f"Preview: {candidate.content_preview[:500]}" if candidate.content_preview else ""}
-
-Write 1200-1500 words:
-- Open with: "We've been getting questions about..."
-- Address the main concern: {candidate.most_common_angle or candidate.content_angle or "this topic"}
-- Include FAQ section with their actual questions
-- SEO keyword: {candidate.key_topics[0] if candidate.key_topics else candidate.title}
-- Actionable, expert but approachable tone
-- FACT-GUARD — for any specific fee/dollar amount, deadline or duration ("30 days"),
-  percentage, code section (BC/MC/AC/NYCECC/ZR/MDL/RCNY), form number (PW1, PW2, TR1,
-  TR8), or effective date: use it ONLY if it appears verbatim in the retrieved
-  knowledge-base documents. If it is NOT in the documents, write [[VERIFY: <the specific
-  fact needed>]] inline instead of guessing a value or omitting it silently. e.g. "the
-  filing fee is [[VERIFY: PW1 filing fee for this work type]]". A wrong fee or code
-  citation destroys credibility — an incomplete-but-correct answer beats an invented one.
-- NEVER build a fee table or list of specific amounts from estimated/typical numbers.
-  Present only amounts/formulas that appear in the documents; flag every other figure as
-  [[VERIFY: ...]].
-{_low_line}
-- REQUIRED final section — a clear call-to-action: getting the filing type wrong costs
-  weeks of rework and examiner scrutiny. State that Green Light Expediting handles NYC
-  DOB filings like this every day and can get it filed right the first time. Invite the
-  reader to reach out to Green Light Expediting (info@greenlightexpediting.com). Always
-  include this CTA as the closing section — never end on the technical content alone.
-
-Format: Markdown with # headers"""
-
-        from core.llm_client import Message
-        prompt_msg = Message(role="user", content=prompt)
-
-        # Pass the retrieved context as rag_context so the anti-fabrication grounding
-        # rules (_build_rag_instructions) actually fire — they were skipped before
-        # because context was only baked into the prompt string. Low temperature for
-        # factual generation.
-        content, _, _ = self.claude.get_response(
-            user_message=prompt,
-            conversation_history=[prompt_msg],
-            rag_context=context,
-            format_for="web",
-            max_tokens_override=4000,
-            temperature_override=0.2,
+        preview = candidate.content_preview[:500] if candidate.content_preview else ""
+        prompt = BLOG_POST_PROMPT.substitute(
+            title=candidate.title,
+            team_questions_count=candidate.team_questions_count,
+            concern_line=(f"Most common concern: {candidate.most_common_angle}"
+                          if candidate.most_common_angle else ""),
+            angle_line=(f"Content angle: {candidate.content_angle}"
+                        if candidate.content_angle else ""),
+            sample_questions="\n".join(f"- {q}" for q in (candidate.team_questions or [])[:5]),
+            source_line=(f"Source: {candidate.source_type}"
+                         if candidate.source_type != "question_cluster" else ""),
+            preview_line=f"Preview: {preview}" if preview else "",
+            main_concern=(candidate.most_common_angle or candidate.content_angle
+                          or "this topic"),
+            seo_keyword=candidate.key_topics[0] if candidate.key_topics else candidate.title,
+            low_line=self._low_coverage_line(candidate, low_confidence_topics),
         )
 
+        content, word_count = self._stream_draft(prompt, context)
+        self._last_word_count = word_count
+
         # Post-generation grounding gate: flag specific claims (fees, dollar amounts,
         # code/section numbers) not backed by the retrieved documents, so they can be
         # reviewed before publish.
@@ -336,11 +687,58 @@ Format: Markdown with # headers"""
             )
 
         # Save the generated draft
-        gen_id = f"gen_{uuid.uuid4().hex[:12]}"
-        self._save_generated(gen_id, candidate_id, "blog_post", candidate.title, content)
+        gen_id = f"gen_{secrets.token_hex(6)}"
+        self._save_generated_async(gen_id, candidate_id, "blog_post", candidate.title,
+                                   content, word_count)
 
         return content
 
+    @staticmethod
+    def _low_coverage_line(candidate: ContentCandidate, low_confidence_topics: list) -> str:
+        """LOW_COVERAGE_LINE if the candidate's title/topics are in Ordino's low-KB list."""
+        low = {t.lower() for t in (low_confidence_topics or [])}
+        if any(t.lower() in low for t in (candidate.key_topics or []) + [candidate.title]):
+            return LOW_COVERAGE_LINE
+        return ""
+
+    def _retrieve_for_draft(self, query: str):
+        """KB retrieval for draft generation, LRU-cached per query string with a TTL."""
+        now = time.monotonic()
+        with self._retrieval_cache_lock:
+            hit = self._retrieval_cache.get(query)
+            if hit and now - hit[0] < _RETRIEVAL_CACHE_TTL:
+                self._retrieval_cache.move_to_end(query)
+                return hit[1]
+
+        result = self.retriever.retrieve(query, top_k=8, min_score=0.6)
+
+        with self._retrieval_cache_lock:
+            self._retrieval_cache[query] = (now, result)
+            self._retrieval_cache.move_to_end(query)
+            while len(self._retrieval_cache) > _RETRIEVAL_CACHE_SIZE:
+                self._retrieval_cache.popitem(last=False)
+        return result
+
+    def _stream_draft(self, prompt: str, context: str) -> Tuple[str, int]:
+        """Stream a long-form draft from Claude. Returns (content, word_count).
+
+        The retrieved context goes in as rag_context so the anti-fabrication
+        grounding rules (_build_rag_instructions) fire. Low temperature for factual
+        generation. Deltas are collected as they arrive and filtered once at the end.
+        """
+        from core.llm_client import Message
+        chunks = []
+        for delta in self.claude.stream_response(
+            user_message=prompt,
+            conversation_history=[Message(role="user", content=prompt)],
+            rag_context=context,
+            max_tokens_override=4000,
+            temperature_override=0.2,
+        ):
+            chunks.append(delta)
+        content = self.claude.filter.filter_response("".join(chunks))
+        return content, len(content.split())
+
     def _grounding_check(self, content: str, sources: list) -> dict:
         """Grounding gate -> the object Ordino persists to generated_content.grounding.
 
@@ -401,44 +799,18 @@ Format: Markdown with # headers"""
 
         # RAG retrieval — same grounding path as blog posts (was a pass-through before).
         query_parts = [candidate.title] + (candidate.key_topics or [])
-        retrieval_result = self.retriever.retrieve(
-            " ".join(p for p in query_parts if p), top_k=8, min_score=0.6)
+        retrieval_result = self._retrieve_for_draft(" ".join(p for p in query_parts if p))
         context = retrieval_result.context
 
-        _low = set(t.lower() for t in (low_confidence_topics or []))
-        _topic_is_low = any(t.lower() in _low for t in (candidate.key_topics or []) + [candidate.title])
-        _low_line = ("- LOW knowledge-base coverage on this topic — bias HARD toward [[VERIFY]] "
-                     "for any specific figure; do not assert numbers." if _topic_is_low else "")
-
-        prompt = f"""Write a brief newsletter section for Green Light Expediting about: {candidate.title}
-
-{candidate.content_preview or candidate.reasoning}
-
-300-400 words, format:
-- What changed / what's happening
-- Why it matters for NYC building owners and developers
-- What to do next
-
-Tone: Direct, actionable, expert
-- FACT-GUARD: for any specific fee/dollar amount, deadline or duration ("30 days"),
-  percentage, code section (BC/MC/AC/NYCECC/ZR), form number (PW1, PW2, TR1, TR8), or
-  effective date — use it ONLY if it appears verbatim in the retrieved documents. If it is
-  NOT in the documents, write [[VERIFY: <the specific fact needed>]] inline instead of
-  guessing or silently omitting.
-{_low_line}"""
-
-        from core.llm_client import Message
-        prompt_msg = Message(role="user", content=prompt)
-
-        content, _, _ = self.claude.get_response(
-            user_message=prompt,
-            conversation_history=[prompt_msg],
-            rag_context=context,          # fires the anti-fabrication grounding rules
-            format_for="web",
-            max_tokens_override=4000,
-            temperature_override=0.2,     # factual generation
+        prompt = NEWSLETTER_PROMPT.substitute(
+            title=candidate.title,
+            background=candidate.content_preview or candidate.reasoning,
+            low_line=self._low_coverage_line(candidate, low_confidence_topics),
         )
 
+        content, word_count = self._stream_draft(prompt, context)
+        self._last_word_count = word_count
+
         # Populate grounding so Ordino gets the same object as for blog posts.
         self._last_grounding = self._grounding_check(content, retrieval_result.sources)
         if self._last_grounding["grounding_score"] < 0.7:
@@ -448,15 +820,65 @@ Tone: Direct, actionable, expert
                 self._last_grounding["ungrounded_claims"],
             )
 
-        gen_id = f"gen_{uuid.uuid4().hex[:12]}"
-        self._save_generated(gen_id, candidate_id, "newsletter", candidate.title, content)
+        gen_id = f"gen_{secrets.token_hex(6)}"
+        self._save_generated_async(gen_id, candidate_id, "newsletter", candidate.title,
+                                   content, word_count)
 
         return content
 
+    def generate_drafts(self, candidate_ids: List[str], content_type: str = "blog_post",
+                        concurrency: Optional[int] = None) -> List[dict]:
+        """Generate drafts for several candidates concurrently.
+
+        Runs generate_blog_post / generate_newsletter on a thread pool, like
+        analyze_updates, so N drafts take about as long as the slowest one.
+        Returns one dict per id, in input order: {"id", "content", "word_count",
+        "grounding"}, or {"id", "error"} for a candidate that failed.
+        """
+        if not candidate_ids:
+            return []
+        generate = (self.generate_blog_post if content_type == "blog_post"
+                    else self.generate_newsletter)
+        workers = concurrency or int(os.getenv("BEACON_LLM_CONCURRENCY", "4"))
+
+        def _one(candidate_id: str) -> dict:
+            try:
+                content = generate(candidate_id)
+            except Exception as e:
+                logger.error(f"generate_drafts: failed for {candidate_id}: {e}")
+                return {"id": candidate_id, "error": str(e)}
+            # Each pool thread reads back its own _last_* stats.
+            return {"id": candidate_id, "content": content,
+                    "word_count": self._last_word_count, "grounding": self._last_grounding}
+
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(candidate_ids)))) as pool:
+            return list(pool.map(_one, candidate_ids))
+
     # ------------------------------------------------------------------
     # Draft Lifecycle: draft → review → approved → published
     # ------------------------------------------------------------------
 
+    def set_candidate_status(self, candidate_id: str, status: str):
+        """Set a candidate's status — Supabase (the store Ordino reads) first,
+        else the local SQLite store."""
+        self.set_candidate_statuses([(candidate_id, status)])
+
+    @_invalidates_reads
+    def set_candidate_statuses(self, updates: List[Tuple[str, str]]):
+        """Set several candidates' statuses from (candidate_id, status) pairs.
+
+        The SQLite fallback applies them all in one transaction (one commit);
+        Supabase gets one update call per candidate.
+        """
+        if self.use_supabase:
+            for candidate_id, status in updates:
+                self.analytics_db.update_content_candidate(candidate_id, status=status)
+            return
+        with self._sqlite_cursor() as c:
+            c.executemany("UPDATE content_candidates SET status = ? WHERE id = ?",
+                          [(status, candidate_id) for candidate_id, status in updates])
+
+    @_invalidates_reads
     def submit_for_review(self, content_id: str) -> dict:
         """Move a draft to review status."""
         if self.use_supabase:
@@ -465,6 +887,7 @@ Tone: Direct, actionable, expert
             }) or {}
         return {}
 
+    @_invalidates_reads
     def approve_draft(self, content_id: str, approved_by: str) -> dict:
         """Approve a reviewed draft."""
         if self.use_supabase:
@@ -476,6 +899,7 @@ Tone: Direct, actionable, expert
             }) or {}
         return {}
 
+    @_invalidates_reads
     def publish_content(self, content_id: str, published_url: str = None) -> dict:
         """Mark content as published."""
         if self.use_supabase:
@@ -491,6 +915,7 @@ Tone: Direct, actionable, expert
     # Retrieval
     # ------------------------------------------------------------------
 
+    @_ttl_cached
     def get_pending_candidates(self, priority: str = None) -> List[ContentCandidate]:
         """Get pending content candidates."""
         if self.use_supabase:
@@ -501,6 +926,61 @@ Tone: Direct, actionable, expert
             return [self._dict_to_candidate(r) for r in rows]
         return self._get_candidates_sqlite(priority)
 
+    @_ttl_cached
+    def get_pending_candidates_raw(self, priority: str = None) -> List[dict]:
+        """Pending candidates as plain dicts of the dashboard list fields
+        (_CANDIDATE_SUMMARY_COLUMNS), ready to serialize — no ContentCandidate
+        round trip."""
+        if self.use_supabase:
+            rows = self.analytics_db.get_content_candidates(
+                status="pending",
+                content_type=None,
+            )
+            return [{col: r.get(col, _CANDIDATE_SUMMARY_DEFAULTS.get(col))
+                     for col in _CANDIDATE_SUMMARY_COLUMNS} for r in rows]
+
+        query = f"{_CANDIDATE_SUMMARY_SELECT} WHERE status = ?"
+        params = ["pending"]
+        if priority:
+            query += " AND priority = ?"
+            params.append(priority)
+        query += " ORDER BY relevance_score DESC"
+        try:
+            with self._sqlite_cursor() as c:
+                c.execute(query, params)
+                return [dict(row) for row in c.fetchall()]
+        except Exception as e:
+            logger.error(f"SQLite query failed: {e}")
+            return []
+
+    @_ttl_cached
+    def get_pending_topics(self) -> set:
+        """Lowercased key_topics across pending candidates, for deduplicating new
+        ones without loading full candidates."""
+        if self.use_supabase:
+            rows = self.analytics_db.get_content_candidates(
+                status="pending",
+                content_type=None,
+            )
+            topic_lists = [r.get("key_topics") or [] for r in rows]
+        else:
+            try:
+                with self._sqlite_cursor() as c:
+                    c.execute("SELECT DISTINCT key_topics FROM content_candidates "
+                              "WHERE status = 'pending' AND key_topics IS NOT NULL")
+                    raw = [row[0] for row in c.fetchall()]
+            except Exception as e:
+                logger.error(f"SQLite query failed: {e}")
+                return set()
+            topic_lists = []
+            for val in raw:
+                try:
+                    topic_lists.append(_json_loads(val) or [])
+                except ValueError:
+                    continue
+        return {str(t).lower() for topics in topic_lists for t in topics}
+
+    @_ttl_cached
     def get_all_candidates(self, status: str = "all") -> List[ContentCandidate]:
         """Get all content candidates, optionally filtered by status."""
         if self.use_supabase:
@@ -508,24 +988,45 @@ Tone: Direct, actionable, expert
             return [self._dict_to_candidate(r) for r in rows]
         return self._get_candidates_sqlite(status=status)
 
+    @_ttl_cached
     def get_drafts(self, status: str = "draft") -> list[dict]:
         """Get generated content drafts."""
         if self.use_supabase:
             return self.analytics_db.get_generated_content(status=status)
-        return []
 
+        # SQLite fallback — same 20-row page as the edge function
+        try:
+            with self._sqlite_cursor() as c:
+                c.execute(
+                    "SELECT * FROM generated_content WHERE status = ? "
+                    "ORDER BY generated_at DESC LIMIT 20",
+                    (status,),
+                )
+                return [dict(row) for row in c.fetchall()]
+        except Exception as e:
+            logger.error(f"SQLite query failed: {e}")
+            return []
+
+    @_ttl_cached
     def get_document_references(self, days: int = 30) -> list[dict]:
         """Get which knowledge base documents are cited most in Beacon's answers."""
         if self.use_supabase:
             return self.analytics_db.get_document_references(days=days)
         return []
 
+    @_ttl_cached
     def get_content_stats(self) -> dict:
         """Get content pipeline statistics."""
         if self.use_supabase:
             return self.analytics_db.get_content_stats()
         return {"total_candidates": 0, "candidates_by_status": {}, "total_drafts": 0}
 
+    def invalidate_read_cache(self):
+        """Drop cached dashboard reads. Call after any candidate/draft write."""
+        with self._read_cache_lock:
+            self._read_cache.clear()
+            self._read_cache_generation += 1
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -536,9 +1037,36 @@ Tone: Direct, actionable, expert
         Semantic match: embed the notice + the recent clean question batch and keep only
         questions above a similarity threshold. Falls back to keyword overlap if embeddings
         are unavailable, so the daily scheduler never breaks on a bad model/API call.
+
+        Results are cached per notice text and window for _TEAM_QUESTIONS_CACHE_TTL
+        seconds (the semantic match depends on the whole text, not just its keywords).
         """
         text = f"{title} {summary}".lower()
-        keywords = [w for w in text.split() if len(w) > 4][:5]
+        keywords = list(dict.fromkeys(
+            w for w in _KEYWORD_RE.findall(text) if w not in _KEYWORD_STOPWORDS
+        ))[:5]
+        if not keywords:
+            return self._lookup_team_questions(title, summary, keywords, days)
+
+        key = (hashlib.blake2b(f"{title}\0{summary}".encode("utf-8"),
+                               digest_size=16).digest(), days)
+        now = time.monotonic()
+        with self._team_q_cache_lock:
+            hit = self._team_q_cache.get(key)
+        if hit and now - hit[0] < _TEAM_QUESTIONS_CACHE_TTL:
+            return copy.deepcopy(hit[1])
+
+        result = self._lookup_team_questions(title, summary, keywords, days)
+        with self._team_q_cache_lock:
+            for k in [k for k, (ts, _) in self._team_q_cache.items()
+                      if now - ts >= _TEAM_QUESTIONS_CACHE_TTL]:
+                del self._team_q_cache[k]
+            self._team_q_cache[key] = (now, copy.deepcopy(result))
+        return result
+
+    def _lookup_team_questions(self, title: str, summary: str, keywords: List[str],
+                               days: int) -> Dict:
+        """Uncached body of _check_team_questions."""
         notice_text = f"{title}. {summary}".strip()
 
         # Fetch the recent, contamination-filtered batch (NOT keyword-limited — semantic
@@ -548,10 +1076,14 @@ Tone: Direct, actionable, expert
         except Exception:
             batch = None
         if batch is None:
+            # Nothing to match on, or no local analytics store — skip the fallback
+            # rather than letting sqlite3.connect create an empty file.
+            if not keywords or not self._analytics_sqlite_available():
+                return {"count": 0}
             try:
                 batch = self._query_team_questions_sqlite(keywords, days)
-            except Exception as e:
-                logger.warning(f"Error checking questions: {e}")
+            except sqlite3.Error:
+                logger.exception("Team-question lookup failed")
                 return {"count": 0}
         if not batch:
             return {"count": 0}
@@ -563,21 +1095,15 @@ Tone: Direct, actionable, expert
         if not matched:
             return {"count": 0}  # real "no matching demand" signal — better than false matches
 
-        questions = [m[0] for m in matched]
-        users = list({m[1] for m in matched})
-
-        from core.llm_client import Message
-        angle_prompt = f"What's the main concern in these questions: {', '.join(questions[:3])}? One sentence."
-        angle_msg = Message(role="user", content=angle_prompt)
-        angle, _, _ = self.claude.get_response(
-            user_message=angle_prompt, conversation_history=[angle_msg]
-        )
+        questions = [m[0] for m in matched[:5]]
+        users = list(dict.fromkeys(m[1] for m in matched))  # keep first-seen order
 
+        # The shared-concern "angle" is produced by the analysis prompt itself
+        # (most_common_angle), not a separate Claude round trip.
         return {
             "count": len(questions),
-            "questions": questions[:5],
+            "questions": questions,
             "users": users,
-            "angle": angle,
         }
 
     def _semantic_filter(self, notice_text: str, pairs: List, threshold: float = 0.55,
@@ -623,11 +1149,9 @@ Tone: Direct, actionable, expert
             a real user question — skip it so it never becomes a content idea (it can
             also carry client data).
         """
-        import requests as req
         from datetime import datetime, timedelta, timezone
         supabase_url = os.getenv("SUPABASE_URL", "")
-        analytics_key = os.getenv("BEACON_ANALYTICS_KEY", "")
-        if not supabase_url or not analytics_key:
+        if not supabase_url or not self._http.headers.get("x-beacon-key"):
             return None
 
         contamination = ("[instructions", "[context:", "[system instruction",
@@ -653,15 +1177,11 @@ Tone: Direct, actionable, expert
                 return True
 
         try:
-            resp = req.post(
+            resp = self._http.post(
                 f"{supabase_url.rstrip('/')}/functions/v1/beacon-analytics",
                 # Fetch a generous batch (edge function is count-limited, no date
                 # param) and apply the real `days` window below.
                 json={"action": "get_recent_conversations", "data": {"limit": 200}},
-                headers={
-                    "Content-Type": "application/json",
-                    "x-beacon-key": analytics_key,
-                },
                 timeout=10,
             )
             resp.raise_for_status()
@@ -685,160 +1205,154 @@ Tone: Direct, actionable, expert
         except Exception:
             return None
 
-    def _query_team_questions_sqlite(self, keywords: List[str], days: int) -> Optional[List]:
-        """Query team questions from SQLite (fallback)."""
-        try:
-            conn = sqlite3.connect("beacon_analytics.db")
-            c = conn.cursor()
-            where_clauses = " OR ".join([f"LOWER(question) LIKE '%{kw}%'" for kw in keywords])
-            c.execute(f"""
-                SELECT question, user_name
-                FROM interactions
-                WHERE ({where_clauses})
-                AND timestamp > datetime('now', '-{days} days')
-                LIMIT 10
-            """)
-            results = c.fetchall()
-            conn.close()
-            return results
-        except Exception:
+    def _analytics_sqlite_available(self) -> bool:
+        """Whether the local analytics DB exists. Only a positive result is cached —
+        the bot may create the file after this engine is constructed."""
+        if not self._analytics_sqlite_exists:
+            self._analytics_sqlite_exists = os.path.exists(_ANALYTICS_DB_PATH)
+        return self._analytics_sqlite_exists
+
+    def query_analytics(self, sql: str, params: tuple = ()) -> Optional[List[tuple]]:
+        """Run a read-only query on the bot's local analytics DB (on the engine's
+        shared connection), or return None if that DB doesn't exist. Raises
+        sqlite3.Error if the query fails."""
+        if not self._analytics_sqlite_available():
             return None
+        with self._analytics_cursor() as c:
+            c.execute(sql, params)
+            return c.fetchall()
+
+    def _query_team_questions_sqlite(self, keywords: List[str], days: int) -> Optional[List]:
+        """Query team questions from SQLite (fallback). Raises sqlite3.Error on failure."""
+        with self._analytics_cursor() as c:
+            c.execute("SELECT 1 FROM sqlite_master WHERE name = 'interactions_fts'")
+            if c.fetchone():
+                # Keywords are plain [a-z] words, so quoting them is enough.
+                c.execute(
+                    _TEAM_QUESTIONS_FTS_SQL,
+                    (" OR ".join(f'"{kw}"*' for kw in keywords), f"-{int(days)} days"),
+                )
+                return c.fetchall()
+            c.execute(
+                _TEAM_QUESTIONS_SQL.format(
+                    where=" OR ".join(["LOWER(question) LIKE ?"] * len(keywords))
+                ),
+                [f"%{kw}%" for kw in keywords] + [f"-{int(days)} days"],
+            )
+            return c.fetchall()
 
     def _analyze_with_claude(self, title: str, summary: str, team_context: Dict) -> Dict:
         """Get AI analysis of a content opportunity."""
-        prompt = f"""Analyze this content opportunity for Green Light Expediting.
-
-Title: {title}
-Summary: {summary}
-
-Team asked {team_context.get('count', 0)} questions about this in last 60 days.
-{f"Most common concern: {team_context.get('angle')}" if team_context.get('angle') else ""}
-
-GLE Services: ALT1/ALT2/ALT3 filings, Certificate of Occupancy, FISP, zoning, permits, DHCR, violations
-
-Respond JSON:
-{{
-  "title": "Better title for content",
-  "content_type": "blog_post" | "newsletter" | "case_study" | "guide",
-  "priority": "high" | "medium" | "low" | "needs_review",
-  "relevance_score": 0-100 (add +20 if team asked 3+ times),
-  "demand_score": 0-100,
-  "expertise_score": 0-100,
-  "search_interest": "high" | "medium" | "low",
-  "affects_services": ["ALT2", etc],
-  "key_topics": ["sidewalk shed", etc],
-  "reasoning": "why this matters",
-  "content_angle": "specific angle to cover",
-  "review_question": "question if uncertain",
-  "recommended_format": "blog_post" | "newsletter_mention" | "comprehensive_guide" | "case_study",
-  "estimated_minutes": 30
-}}"""
+        questions = team_context.get("questions") or []
+        team_block = ("Team questions (verbatim):\n" + "\n".join(f"- {q}" for q in questions)
+                      if questions else "")
+        prompt = ANALYSIS_PROMPT.substitute(
+            title=title, summary=summary,
+            team_count=team_context.get("count", 0), team_block=team_block,
+        )
 
         from core.llm_client import Message
         user_msg = Message(role="user", content=prompt)
 
-        # format_for="web" so the JSON reply is NOT run through the google_chat
-        # text formatter (the default), which rewrites markdown in string values.
-        response, _, _ = self.claude.get_response(
-            user_message=prompt,
-            conversation_history=[user_msg],
-            format_for="web",
-        )
-
         try:
-            # The model frequently wraps the JSON in prose ("Here's the analysis:
-            # {...}") or ``` fences. Stripping fences alone isn't enough — that made
-            # EVERY candidate fall back to "Failed to parse analysis". Extract the
-            # outermost {...} object before parsing.
-            import re as _re
-            raw = response.replace("```json", "").replace("```", "").strip()
-            match = _re.search(r"\{.*\}", raw, _re.DOTALL)
-            if match:
-                raw = match.group(0)
-            return json.loads(raw)
+            return self.claude.get_tool_input(
+                user_message=prompt,
+                conversation_history=[user_msg],
+                tool=ANALYSIS_TOOL,
+            )
         except Exception as e:
-            logger.warning("analyze_update: could not parse analysis JSON: %s", e)
+            logger.warning("analyze_update: analysis call failed: %s", e)
             return {
                 "title": title,
                 "content_type": "uncertain",
                 "priority": "needs_review",
                 "relevance_score": 50,
-                "reasoning": "Failed to parse analysis",
+                "reasoning": "Analysis failed",
                 "affects_services": [],
                 "key_topics": []
             }
 
+    @staticmethod
+    def _candidate_values(c: ContentCandidate) -> list:
+        """Column-ordered values for a candidate, list fields defaulted to []."""
+        values = list(_CANDIDATE_GET(c))
+        for i in _CANDIDATE_JSON_IDX:
+            values[i] = values[i] or []
+        return values
+
+    @staticmethod
+    def _sqlite_candidate_row(values: list) -> list:
+        """JSON-encode the list columns of _candidate_values() for SQLite."""
+        for i in _CANDIDATE_JSON_IDX:
+            values[i] = _json_dumps(values[i])
+        return values
+
+    @_invalidates_reads
     def _save_candidate(self, c: ContentCandidate):
         """Save candidate to Supabase (preferred) or SQLite (fallback)."""
-        candidate_dict = {
-            "id": c.id,
-            "title": c.title,
-            "content_type": c.content_type,
-            "priority": c.priority,
-            "status": c.status,
-            "relevance_score": c.relevance_score,
-            "demand_score": c.demand_score,
-            "expertise_score": c.expertise_score,
-            "search_interest": c.search_interest,
-            "affects_services": c.affects_services or [],
-            "key_topics": c.key_topics or [],
-            "reasoning": c.reasoning,
-            "review_question": c.review_question,
-            "content_angle": c.content_angle,
-            "team_questions_count": c.team_questions_count,
-            "team_questions": c.team_questions or [],
-            "most_common_angle": c.most_common_angle,
-            "source_type": c.source_type,
-            "source_url": c.source_url,
-            "source_email_id": c.source_email_id,
-            "content_preview": c.content_preview,
-            "recommended_format": c.recommended_format,
-            "estimated_minutes": c.estimated_minutes,
-            "created_at": c.created_at,
-        }
+        values = self._candidate_values(c)
 
         if self.use_supabase:
             try:
-                self.analytics_db.save_content_candidate(candidate_dict)
+                self.analytics_db.save_content_candidate(dict(zip(_CANDIDATE_COLUMNS, values)))
                 return
             except Exception as e:
                 logger.warning(f"Supabase save failed, falling back to SQLite: {e}")
 
         # SQLite fallback
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-        cur.execute("""
-            INSERT OR REPLACE INTO content_candidates
-            (id, title, content_type, priority, relevance_score, demand_score,
-             expertise_score, search_interest, affects_services, key_topics,
-             reasoning, review_question, content_angle, team_questions_count,
-             team_questions, most_common_angle, source_type, source_url,
-             source_email_id, content_preview, recommended_format,
-             estimated_minutes, status, created_at)
-            VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-        """, (
-            c.id, c.title, c.content_type, c.priority, c.relevance_score,
-            c.demand_score, c.expertise_score, c.search_interest,
-            json.dumps(c.affects_services or []), json.dumps(c.key_topics or []),
-            c.reasoning, c.review_question, c.content_angle,
-            c.team_questions_count, json.dumps(c.team_questions or []),
-            c.most_common_angle, c.source_type, c.source_url,
-            c.source_email_id, c.content_preview, c.recommended_format,
-            c.estimated_minutes, c.status, c.created_at
-        ))
-        conn.commit()
-        conn.close()
+        with self._sqlite_cursor() as cur:
+            cur.execute(_CANDIDATE_INSERT, self._sqlite_candidate_row(values))
 
+    @_invalidates_reads
+    def save_candidates(self, candidates: List[ContentCandidate]):
+        """Save many candidates at once: one Supabase call, or one SQLite transaction."""
+        if not candidates:
+            return
+        rows = [self._candidate_values(c) for c in candidates]
+
+        if self.use_supabase:
+            try:
+                self.analytics_db.save_content_candidates(
+                    [dict(zip(_CANDIDATE_COLUMNS, values)) for values in rows]
+                )
+                return
+            except Exception as e:
+                logger.warning(f"Supabase bulk save failed, falling back to SQLite: {e}")
+
+        # SQLite fallback — a single executemany commits once for the whole batch.
+        with self._sqlite_cursor() as cur:
+            cur.executemany(_CANDIDATE_INSERT, (self._sqlite_candidate_row(v) for v in rows))
+
+    def _save_generated_async(self, *args) -> Future:
+        """Queue _save_generated on the I/O pool. Failures are logged."""
+        future = self._io_pool.submit(self._save_generated, *args)
+        with self._pending_saves_lock:
+            self._pending_saves.add(future)
+        future.add_done_callback(self._on_save_done)
+        return future
+
+    def _on_save_done(self, future: Future):
+        with self._pending_saves_lock:
+            self._pending_saves.discard(future)
+        # Reads cached while the save was in flight are stale now.
+        self.invalidate_read_cache()
+        if future.exception() is not None:
+            logger.error("Saving generated draft failed", exc_info=future.exception())
+
+    @_invalidates_reads
     def _save_generated(self, gen_id: str, candidate_id: str,
-                         content_type: str, title: str, content: str):
+                         content_type: str, title: str, content: str,
+                         word_count: Optional[int] = None):
         """Save generated content to Supabase or SQLite."""
+        if word_count is None:
+            word_count = len(content.split())
         data = {
             "id": gen_id,
             "candidate_id": candidate_id,
             "content_type": content_type,
             "title": title,
             "content": content,
-            "word_count": len(content.split()),
+            "word_count": word_count,
             "status": "draft",
             "generated_at": datetime.now().isoformat(),
         }
@@ -851,32 +1365,26 @@ Respond JSON:
                 logger.warning(f"Supabase save failed, falling back to SQLite: {e}")
 
         # SQLite fallback
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("""
-            INSERT INTO generated_content
-            (id, candidate_id, content_type, title, content, word_count, status, generated_at)
-            VALUES (?,?,?,?,?,?,?,?)
-        """, (gen_id, candidate_id, content_type, title, content,
-              len(content.split()), "draft", datetime.now().isoformat()))
-        conn.commit()
-        conn.close()
+        with self._sqlite_cursor() as c:
+            c.execute("""
+                INSERT INTO generated_content
+                (id, candidate_id, content_type, title, content, word_count, status, generated_at)
+                VALUES (?,?,?,?,?,?,?,?)
+            """, (gen_id, candidate_id, content_type, title, content,
+                  word_count, "draft", data["generated_at"]))
 
     def _get_candidate(self, candidate_id: str) -> Optional[ContentCandidate]:
         """Get a single candidate by ID."""
         if self.use_supabase:
-            candidates = self.analytics_db.get_content_candidates(status="all")
-            for c in candidates:
-                if c.get("id") == candidate_id:
-                    return self._dict_to_candidate(c)
+            row = self.analytics_db.get_content_candidate(candidate_id)
+            if row:
+                return self._dict_to_candidate(row)
 
         # SQLite fallback
         try:
-            conn = sqlite3.connect(self.db_path)
-            c = conn.cursor()
-            c.execute("SELECT * FROM content_candidates WHERE id = ?", (candidate_id,))
-            row = c.fetchone()
-            conn.close()
+            with self._sqlite_cursor() as c:
+                c.execute(f"{_CANDIDATE_SELECT} WHERE id = ?", (candidate_id,))
+                row = c.fetchone()
             if row:
                 return self._row_to_candidate(row)
         except Exception:
@@ -887,20 +1395,19 @@ Respond JSON:
                                 status: str = None) -> List[ContentCandidate]:
         """Get candidates from SQLite (fallback)."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            c = conn.cursor()
-            query = "SELECT * FROM content_candidates WHERE 1=1"
-            if status and status != "all":
-                query += f" AND status = '{status}'"
-            elif not status:
-                query += " AND status = 'pending'"
+            query = f"{_CANDIDATE_SELECT} WHERE 1=1"
+            params = []
+            if status != "all":
+                query += " AND status = ?"
+                params.append(status or "pending")
             if priority:
-                query += f" AND priority = '{priority}'"
+                query += " AND priority = ?"
+                params.append(priority)
             query += " ORDER BY relevance_score DESC"
 
-            c.execute(query)
-            rows = c.fetchall()
-            conn.close()
+            with self._sqlite_cursor() as c:
+                c.execute(query, params)
+                rows = c.fetchall()
             return [self._row_to_candidate(row) for row in rows]
         except Exception as e:
             logger.error(f"SQLite query failed: {e}")
@@ -908,65 +1415,40 @@ Respond JSON:
 
     def _dict_to_candidate(self, d: dict) -> ContentCandidate:
         """Convert a Supabase row dict to ContentCandidate."""
-        return ContentCandidate(
-            id=d.get("id", ""),
-            title=d.get("title", ""),
-            content_type=d.get("content_type", "blog_post"),
-            priority=d.get("priority", "medium"),
-            relevance_score=d.get("relevance_score", 50),
-            demand_score=d.get("demand_score"),
-            expertise_score=d.get("expertise_score"),
-            search_interest=d.get("search_interest", "unknown"),
-            affects_services=d.get("affects_services", []),
-            key_topics=d.get("key_topics", []),
-            reasoning=d.get("reasoning", ""),
-            review_question=d.get("review_question"),
-            content_angle=d.get("content_angle"),
-            team_questions_count=d.get("team_questions_count", 0),
-            team_questions=d.get("team_questions", []),
-            most_common_angle=d.get("most_common_angle"),
-            source_type=d.get("source_type", "question_cluster"),
-            source_url=d.get("source_url"),
-            source_email_id=d.get("source_email_id"),
-            content_preview=d.get("content_preview"),
-            recommended_format=d.get("recommended_format"),
-            estimated_minutes=d.get("estimated_minutes"),
-            status=d.get("status", "pending"),
-            created_at=d.get("created_at", ""),
-        )
-
-    def _row_to_candidate(self, row: tuple) -> ContentCandidate:
-        """Convert a SQLite row to ContentCandidate."""
-        def _parse_json(val, default=None):
-            if default is None:
-                default = []
-            if isinstance(val, str):
-                try:
-                    return json.loads(val)
-                except Exception:
-                    return default
-            return val if val else default
+        fields = dict(_CANDIDATE_ROW_DEFAULTS)
+        fields.update((col, d[col]) for col in _CANDIDATE_COLUMNS if col in d)
+        for col in _CANDIDATE_LIST_COLUMNS:
+            fields.setdefault(col, [])
+        return ContentCandidate(**fields)
+
+    def _row_to_candidate(self, row: sqlite3.Row) -> ContentCandidate:
+        """Convert a SQLite row (selected via _CANDIDATE_SELECT) to ContentCandidate."""
+        def _parse_json(val):
+            try:
+                return _json_loads(val) if val else []
+            except ValueError:
+                return []
 
         return ContentCandidate(
-            id=row[0], title=row[1], content_type=row[2], priority=row[3],
-            relevance_score=row[4],
-            demand_score=row[5] if len(row) > 5 else None,
-            expertise_score=row[6] if len(row) > 6 else None,
-            search_interest=row[7] if len(row) > 7 else "unknown",
-            affects_services=_parse_json(row[8] if len(row) > 8 else "[]"),
-            key_topics=_parse_json(row[9] if len(row) > 9 else "[]"),
-            reasoning=row[10] if len(row) > 10 else "",
-            review_question=row[11] if len(row) > 11 else None,
-            content_angle=row[12] if len(row) > 12 else None,
-            team_questions_count=row[13] if len(row) > 13 else 0,
-            team_questions=_parse_json(row[14] if len(row) > 14 else "[]"),
-            most_common_angle=row[15] if len(row) > 15 else None,
-            source_type=row[16] if len(row) > 16 else "question_cluster",
-            source_url=row[17] if len(row) > 17 else None,
-            source_email_id=row[18] if len(row) > 18 else None,
-            content_preview=row[19] if len(row) > 19 else None,
-            recommended_format=row[20] if len(row) > 20 else None,
-            estimated_minutes=row[21] if len(row) > 21 else None,
-            status=row[22] if len(row) > 22 else "pending",
-            created_at=row[23] if len(row) > 23 else "",
+            id=row["id"], title=row["title"], content_type=row["content_type"],
+            priority=row["priority"], relevance_score=row["relevance_score"],
+            demand_score=row["demand_score"],
+            expertise_score=row["expertise_score"],
+            search_interest=row["search_interest"] or "unknown",
+            affects_services=_parse_json(row["affects_services"]),
+            key_topics=_parse_json(row["key_topics"]),
+            reasoning=row["reasoning"] or "",
+            review_question=row["review_question"],
+            content_angle=row["content_angle"],
+            team_questions_count=row["team_questions_count"] or 0,
+            team_questions=_parse_json(row["team_questions"]),
+            most_common_angle=row["most_common_angle"],
+            source_type=row["source_type"] or "question_cluster",
+            source_url=row["source_url"],
+            source_email_id=row["source_email_id"],
+            content_preview=row["content_preview"],
+            recommended_format=row["recommended_format"],
+            estimated_minutes=row["estimated_minutes"],
+            status=row["status"] or "pending",
+            created_at=row["created_at"] or "",
         )
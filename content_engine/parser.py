@@ -21,20 +21,89 @@ formatted email), it falls back to the legacy header/list extractor.
 """
 
 import re
+import copy
+import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple
+from urllib.parse import urljoin, urlparse
 from datetime import datetime
 
-from bs4 import BeautifulSoup, NavigableString, Tag
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
+from dateutil import parser as dateparser
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# C-backed lxml parses these table-heavy emails several times faster than the
+# pure-Python html.parser; fall back to the latter if lxml isn't installed.
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
 # Heading font sizes (in pt). Story/section headings are ~16pt; the masthead is
 # ~43pt and must be excluded.
 _HEADING_MIN_PT = 14.0
 _HEADING_MAX_PT = 26.0
 
+# Newsletter date, e.g. "July 2, 2026" or "07/02/2026" — one alternation so the
+# text is scanned once.
+_DATE_RE = re.compile(
+    r'([A-Z][a-z]+\.?\s+\d{1,2},\s*\d{4})'   # July 2, 2026
+    r'|(\d{1,2}/\d{1,2}/\d{4})'                # 07/02/2026
+)
+
+# (connect, read) timeout for link requests — fail fast on unreachable hosts.
+_HTTP_TIMEOUT = (3.05, 10)
+
+# Base for relative links in newsletter emails (which have no URL of their own).
+_NYC_GOV = 'https://www.nyc.gov/'
+
+_NON_NAV_SCHEMES = ('javascript:', 'mailto:', 'tel:')
+
+# Links worth following from a linked page: PDFs and DOB pages.
+_DOB_LINK_RE = re.compile(r'\.pdf|/buildings/|/dob', re.IGNORECASE)
+
+# Linked files we have no text extractor for (PDFs are handled separately).
+_SKIP_EXTENSIONS = ('.zip', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+                    '.jpg', '.jpeg', '.png', '.gif', '.mp4')
+
+# Most of a linked HTML page we read; the text is cut to 5000 chars anyway.
+_MAX_PAGE_BYTES = 256 * 1024
+
+# Linked pages are only mined for body text and links, so <head> (meta, inline
+# scripts/styles, JSON-LD) is never built into the tree.
+_BODY_ONLY = SoupStrainer('body')
+
+# Concurrent requests when resolving/fetching a newsletter's links.
+_FETCH_WORKERS = 8
+
+# Linked-page cache (URL -> (expires_at, text, links)), shared by all parser
+# instances in the process.
+_PAGE_CACHE_SIZE = 512
+_PAGE_CACHE_TTL = 24 * 3600         # seconds
+_PAGE_CACHE_EMPTY_TTL = 3600        # seconds, for failed/empty fetches
+_page_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_page_cache_lock = threading.Lock()
+
+# Parsed-email cache (blake2b(html) + fetch flag -> (expires_at, result)): the
+# same newsletter is often forwarded by several team members.
+_PARSE_CACHE_SIZE = 128
+_PARSE_CACHE_TTL = 24 * 3600        # seconds
+_parse_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+# How much leading text _extract_date searches before falling back to the
+# whole document.
+_DATE_SCAN_CHARS = 4096
+
 # Boilerplate heading/title text we never want to emit as an update.
 _SKIP_TITLES = {
     "buildings", "news", "buildings news", "dob now", "service notices",
@@ -42,6 +111,15 @@ _SKIP_TITLES = {
 }
 
 
+def _absolutize(href: str, base: str) -> str:
+    """Absolute URL for an href on a page at `base`; '' for javascript:/mailto:/
+    fragment-only links, which aren't worth a request."""
+    href = (href or '').strip()
+    if not href or href.startswith('#') or href.lower().startswith(_NON_NAV_SCHEMES):
+        return ''
+    return urljoin(base, href)
+
+
 class DOBNewsletterParser:
     """Parse NYC DOB Buildings News HTML emails."""
 
@@ -50,6 +128,16 @@ class DOBNewsletterParser:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        # Pool sized for the concurrent link fan-out (most links share a few
+        # hosts), with retries on transient server errors.
+        adapter = HTTPAdapter(
+            pool_connections=16, pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=(429, 500, 502, 503, 504),
+                              raise_on_status=False),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
     # ------------------------------------------------------------------
     # Public entry point
@@ -80,8 +168,31 @@ class DOBNewsletterParser:
                     ...
                 ]
             }
+
+        Results are cached by content hash, so a duplicate of an email parsed
+        in the last day costs a hash and a copy.
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        key = (hashlib.blake2b(html_content.encode('utf-8', 'surrogatepass'),
+                               digest_size=16).digest(), fetch_linked_pages)
+        now = time.monotonic()
+        with _parse_cache_lock:
+            hit = _parse_cache.get(key)
+            if hit and now < hit[0]:
+                _parse_cache.move_to_end(key)
+                logger.info("DOB newsletter already parsed; using cached result")
+                return copy.deepcopy(hit[1])
+
+        result = self._parse_email(html_content, fetch_linked_pages)
+
+        with _parse_cache_lock:
+            _parse_cache[key] = (now + _PARSE_CACHE_TTL, copy.deepcopy(result))
+            _parse_cache.move_to_end(key)
+            while len(_parse_cache) > _PARSE_CACHE_SIZE:
+                _parse_cache.popitem(last=False)
+        return result
+
+    def _parse_email(self, html_content: str, fetch_linked_pages: bool) -> Dict:
+        soup = BeautifulSoup(html_content, _HTML_PARSER)
         for tag in soup(['script', 'style']):
             tag.decompose()
 
@@ -106,6 +217,7 @@ class DOBNewsletterParser:
         # the poller can ingest each PDF cleanly, and leave the section text as its
         # own email blurb.
         if fetch_linked_pages:
+            per_update = []
             for u in updates:
                 links = []
                 if u.get('source_url'):
@@ -113,9 +225,15 @@ class DOBNewsletterParser:
                 for link in (u.get('referenced_links') or []):
                     if link not in links:
                         links.append(link)
+                per_update.append(links[:8])
+            # Resolve every link across all updates concurrently (each is a network
+            # round trip through the click-tracker), then assign back in order.
+            unique = list(dict.fromkeys(link for links in per_update for link in links))
+            final_urls = dict(zip(unique, self._map_concurrent(self._resolve_url, unique)))
+            for u, links in zip(updates, per_update):
                 resolved = []
-                for link in links[:8]:
-                    final = self._resolve_url(link)
+                for link in links:
+                    final = final_urls[link]
                     if final and final not in resolved:
                         resolved.append(final)
                 if resolved:
@@ -129,24 +247,35 @@ class DOBNewsletterParser:
     # Date
     # ------------------------------------------------------------------
     def _extract_date(self, soup: BeautifulSoup) -> str:
-        """Extract the newsletter date, tolerant of embedded whitespace."""
+        """Extract the newsletter date, tolerant of embedded whitespace.
+
+        The date sits in the masthead, so only the first _DATE_SCAN_CHARS of text
+        are joined and searched; the whole document is searched only if that
+        finds nothing.
+        """
+        head, size = [], 0
+        for s in soup.stripped_strings:
+            head.append(s)
+            size += len(s)
+            if size >= _DATE_SCAN_CHARS:
+                break
+        date = self._find_date(' '.join(head))
+        if date is None and size >= _DATE_SCAN_CHARS:
+            date = self._find_date(soup.get_text(' '))
+        return date or datetime.now().strftime("%Y-%m-%d")
+
+    @staticmethod
+    def _find_date(text: str) -> Optional[str]:
+        """First parseable date in text as YYYY-MM-DD, or None."""
         # Collapse all whitespace (the email splits dates across lines/tabs,
         # e.g. "July 2,\n\t\t2026").
-        text = ' '.join(soup.get_text(' ').split())
-
-        patterns = [
-            r'([A-Z][a-z]+\.?\s+\d{1,2},\s*\d{4})',   # July 2, 2026
-            r'(\d{1,2}/\d{1,2}/\d{4})',                # 07/02/2026
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if match:
-                try:
-                    from dateutil import parser as dateparser
-                    return dateparser.parse(match.group(1)).strftime("%Y-%m-%d")
-                except Exception:
-                    continue
-        return datetime.now().strftime("%Y-%m-%d")
+        text = ' '.join(text.split())
+        for match in _DATE_RE.finditer(text):
+            try:
+                return dateparser.parse(match.group(0)).strftime("%Y-%m-%d")
+            except (ValueError, OverflowError):
+                continue  # e.g. "Issue 12, 2026" — not a date
+        return None
 
     # ------------------------------------------------------------------
     # Primary extractor: real GovDelivery newsletter format
@@ -285,28 +414,35 @@ class DOBNewsletterParser:
         "Hearings", "Rules", "Weather", "Code Notes",
     ]
 
+    # Any section name inside a header's (lowercased) text.
+    _LEGACY_SECTION_RE = re.compile('|'.join(re.escape(s.lower()) for s in _LEGACY_SECTIONS))
+
     def _extract_legacy(self, soup: BeautifulSoup) -> List[Dict]:
+        # One pass over the candidate headers, noting the first header that names
+        # each section ("Hearings + Rules" names two).
+        first_header = {}
+        for header in soup.find_all(['h2', 'h3', 'strong', 'b']):
+            for m in self._LEGACY_SECTION_RE.finditer(header.get_text().lower()):
+                first_header.setdefault(m.group(0), header)
+            if len(first_header) == len(self._LEGACY_SECTIONS):
+                break
+
         updates: List[Dict] = []
         for section in self._LEGACY_SECTIONS:
-            updates.extend(self._extract_section(soup, section))
+            header = first_header.get(section.lower())
+            if header is not None:
+                updates.extend(self._extract_section(section, header))
         return updates
 
-    def _extract_section(self, soup: BeautifulSoup, section_name: str) -> List[Dict]:
-        updates = []
-        headers = soup.find_all(['h2', 'h3', 'strong', 'b'])
-        for header in headers:
-            if section_name.lower() in header.get_text().lower():
-                for item in self._extract_items_after_header(header):
-                    updates.append({
-                        "title": item['title'],
-                        "category": section_name,
-                        "summary": item['summary'],
-                        "source_url": item['link'],
-                        "referenced_links": [],
-                        "full_content": item['summary'],
-                    })
-                break
-        return updates
+    def _extract_section(self, section_name: str, header: Tag) -> List[Dict]:
+        return [{
+            "title": item['title'],
+            "category": section_name,
+            "summary": item['summary'],
+            "source_url": item['link'],
+            "referenced_links": [],
+            "full_content": item['summary'],
+        } for item in self._extract_items_after_header(header)]
 
     def _extract_items_after_header(self, header) -> List[Dict]:
         items = []
@@ -332,9 +468,7 @@ class DOBNewsletterParser:
         link = li.find('a')
         if not link:
             return None
-        href = link.get('href', '')
-        if href and not href.startswith('http'):
-            href = f"https://www.nyc.gov{href}"
+        href = _absolutize(link.get('href', ''), _NYC_GOV)
         return {
             'title': link.get_text().strip(),
             'summary': li.get_text().strip(),
@@ -350,7 +484,7 @@ class DOBNewsletterParser:
         if not url or not url.startswith('http'):
             return url or ''
         try:
-            r = self.session.get(url, timeout=10, stream=True, allow_redirects=True)
+            r = self.session.get(url, timeout=_HTTP_TIMEOUT, stream=True, allow_redirects=True)
             final = str(r.url or url)
             r.close()
             return final
@@ -358,49 +492,105 @@ class DOBNewsletterParser:
             logger.warning(f"Could not resolve {url}: {e}")
             return ''
 
+    def fetch_pages(self, urls: List[str]) -> List[Tuple[str, List[str]]]:
+        """_fetch_page_content for each URL, fetched concurrently, in input order."""
+        return self._map_concurrent(self._fetch_page_content, urls)
+
+    @staticmethod
+    def _map_concurrent(fn, items: List) -> List:
+        """fn over items on a small thread pool (network-bound), in input order."""
+        if len(items) <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(_FETCH_WORKERS, len(items))) as pool:
+            return list(pool.map(fn, items))
+
     def _fetch_page_content(self, url: str) -> Tuple[str, List[str]]:
+        """(text, referenced_links) for a linked page, cached per URL across
+        parser instances — newsletters link the same DOB pages week after week."""
         if not url or not url.startswith('http'):
             return "", []
+        if urlparse(url).path.lower().endswith(_SKIP_EXTENSIONS):
+            return "", []  # binary document we can't extract — don't download it
+        now = time.monotonic()
+        with _page_cache_lock:
+            hit = _page_cache.get(url)
+            if hit and now < hit[0]:
+                _page_cache.move_to_end(url)
+                return hit[1], list(hit[2])
+
+        content, links = self._download_page_content(url)
+
+        # Empty results (errors, blank pages) are kept briefly so a broken link
+        # isn't re-requested on every newsletter, but is retried within the hour.
+        ttl = _PAGE_CACHE_TTL if content else _PAGE_CACHE_EMPTY_TTL
+        with _page_cache_lock:
+            _page_cache[url] = (now + ttl, content, tuple(links))
+            _page_cache.move_to_end(url)
+            while len(_page_cache) > _PAGE_CACHE_SIZE:
+                _page_cache.popitem(last=False)
+        return content, links
+
+    def _download_page_content(self, url: str) -> Tuple[str, List[str]]:
         try:
             # SSRF guard: this fetches links harvested from untrusted email/document
             # content, so validate the host (and every redirect hop) is a public IP.
             from core.net_guard import safe_get
-            response = safe_get(url, session=self.session, timeout=15)
+            response = safe_get(url, session=self.session, timeout=_HTTP_TIMEOUT,
+                                stream=True)
+        except Exception as e:
+            logger.error(f"Error fetching {url}: {e}")
+            return "", []
+        try:
             response.raise_for_status()
-
-            # DOB service-notice links are GovDelivery trackers that redirect to a
-            # PDF. Parsing PDF bytes as HTML yields binary garbage, so detect a PDF
-            # response (by content-type or the post-redirect URL) and extract its
-            # text with PyMuPDF instead.
-            ctype = response.headers.get('content-type', '').lower()
-            final_url = str(getattr(response, 'url', '') or url).lower()
-            if 'pdf' in ctype or final_url.endswith('.pdf'):
-                try:
-                    import fitz  # PyMuPDF
-                    parts = []
-                    with fitz.open(stream=response.content, filetype='pdf') as doc:
-                        for page in doc:
-                            parts.append(page.get_text())
-                    return "\n".join(parts).strip()[:5000], []
-                except Exception as e:
-                    logger.warning(f"PDF extract failed for {url}: {e}")
-                    return "", []
-
-            soup = BeautifulSoup(response.content, 'html.parser')
-            for script in soup(['script', 'style']):
-                script.decompose()
-            content = soup.get_text(separator='\n', strip=True)
-            referenced_links = []
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                if not href.startswith('http'):
-                    href = f"https://www.nyc.gov{href}"
-                if any(ext in href.lower() for ext in ['.pdf', '/buildings/', '/dob']):
-                    referenced_links.append(href)
-            return content[:5000], list(set(referenced_links))
+            return self._page_content(url, response)
         except Exception as e:
             logger.error(f"Error fetching {url}: {e}")
             return "", []
+        finally:
+            response.close()
+
+    def _page_content(self, url: str, response) -> Tuple[str, List[str]]:
+        """Text and DOB links from a streamed response. Only PDFs are read in
+        full; HTML is read up to _MAX_PAGE_BYTES and other types are skipped."""
+        # DOB service-notice links are GovDelivery trackers that redirect to a
+        # PDF. Parsing PDF bytes as HTML yields binary garbage, so detect a PDF
+        # response (by content-type or the post-redirect URL) and extract its
+        # text with PyMuPDF instead.
+        ctype = response.headers.get('content-type', '').lower()
+        final_url = str(getattr(response, 'url', '') or url).lower()
+        if 'pdf' in ctype or final_url.endswith('.pdf'):
+            try:
+                import fitz  # PyMuPDF
+                parts = []
+                with fitz.open(stream=response.content, filetype='pdf') as doc:
+                    for page in doc:
+                        parts.append(page.get_text())
+                return "\n".join(parts).strip()[:5000], []
+            except Exception as e:
+                logger.warning(f"PDF extract failed for {url}: {e}")
+                return "", []
+
+        if ctype and not ctype.startswith('text/') and 'html' not in ctype:
+            logger.info(f"Skipping non-HTML page {url} ({ctype})")
+            return "", []
+
+        html = response.raw.read(_MAX_PAGE_BYTES, decode_content=True)
+        soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_BODY_ONLY)
+        if not soup.contents:
+            # html.parser doesn't infer a <body> for bare fragments.
+            soup = BeautifulSoup(html, _HTML_PARSER)
+        # Scripts/styles inside <body> still get through the strainer.
+        for script in soup(['script', 'style']):
+            script.decompose()
+        content = soup.get_text(separator='\n', strip=True)
+        # Relative links resolve against the page we actually landed on.
+        base = str(getattr(response, 'url', '') or url)
+        referenced_links = []
+        for link in soup.find_all('a', href=_DOB_LINK_RE):
+            href = _absolutize(link['href'], base)
+            if href:
+                referenced_links.append(href)
+        return content[:5000], list(dict.fromkeys(referenced_links))
 
 
 # Email forwarding handler
@@ -0,0 +1,130 @@
+"""
+Prompt templates for the Content Intelligence engine.
+
+Static prompt text lives here as string.Template constants; the engine only
+fills in the per-candidate fields.
+"""
+
+from string import Template
+
+SUMMARIZE_EMAIL_PROMPT = Template("""Extract the key information from this email that could be turned into content for Green Light Expediting's blog or newsletter.
+
+From: $sender
+Subject: $subject
+$body
+
+Summarize in 2-3 paragraphs:
+1. What's the core topic/question/scenario?
+2. What expert knowledge or process is discussed?
+3. Why would GLE's clients find this valuable?""")
+
+BLOG_POST_PROMPT = Template("""Write a blog post for Green Light Expediting.
+
+Title: $title
+
+Team has been asking about this $team_questions_count times.
+$concern_line
+$angle_line
+
+Sample questions they asked:
+$sample_questions
+
+$source_line
+$preview_line
+
+Write 1200-1500 words:
+- Open with: "We've been getting questions about..."
+- Address the main concern: $main_concern
+- Include FAQ section with their actual questions
+- SEO keyword: $seo_keyword
+- Actionable, expert but approachable tone
+- FACT-GUARD — for any specific fee/dollar amount, deadline or duration ("30 days"),
+  percentage, code section (BC/MC/AC/NYCECC/ZR/MDL/RCNY), form number (PW1, PW2, TR1,
+  TR8), or effective date: use it ONLY if it appears verbatim in the retrieved
+  knowledge-base documents. If it is NOT in the documents, write [[VERIFY: <the specific
+  fact needed>]] inline instead of guessing a value or omitting it silently. e.g. "the
+  filing fee is [[VERIFY: PW1 filing fee for this work type]]". A wrong fee or code
+  citation destroys credibility — an incomplete-but-correct answer beats an invented one.
+- NEVER build a fee table or list of specific amounts from estimated/typical numbers.
+  Present only amounts/formulas that appear in the documents; flag every other figure as
+  [[VERIFY: ...]].
+$low_line
+- REQUIRED final section — a clear call-to-action: getting the filing type wrong costs
+  weeks of rework and examiner scrutiny. State that Green Light Expediting handles NYC
+  DOB filings like this every day and can get it filed right the first time. Invite the
+  reader to reach out to Green Light Expediting (info@greenlightexpediting.com). Always
+  include this CTA as the closing section — never end on the technical content alone.
+
+Format: Markdown with # headers""")
+
+NEWSLETTER_PROMPT = Template("""Write a brief newsletter section for Green Light Expediting about: $title
+
+$background
+
+300-400 words, format:
+- What changed / what's happening
+- Why it matters for NYC building owners and developers
+- What to do next
+
+Tone: Direct, actionable, expert
+- FACT-GUARD: for any specific fee/dollar amount, deadline or duration ("30 days"),
+  percentage, code section (BC/MC/AC/NYCECC/ZR), form number (PW1, PW2, TR1, TR8), or
+  effective date — use it ONLY if it appears verbatim in the retrieved documents. If it is
+  NOT in the documents, write [[VERIFY: <the specific fact needed>]] inline instead of
+  guessing or silently omitting.
+$low_line""")
+
+# Added to draft prompts when Ordino flags the topic as thinly covered in the KB.
+LOW_COVERAGE_LINE = ("- LOW knowledge-base coverage on this topic — bias HARD toward [[VERIFY]] "
+                     "for any specific figure; do not assert numbers.")
+
+ANALYSIS_PROMPT = Template("""Analyze this content opportunity for Green Light Expediting.
+
+Title: $title
+Summary: $summary
+
+Team asked $team_count questions about this in last 60 days.
+$team_block
+
+GLE Services: ALT1/ALT2/ALT3 filings, Certificate of Occupancy, FISP, zoning, permits, DHCR, violations
+
+Record your analysis with the emit_analysis tool.""")
+
+# Structured reply for ANALYSIS_PROMPT (forced tool call, see ClaudeClient.get_tool_input).
+ANALYSIS_TOOL = {
+    "name": "emit_analysis",
+    "description": "Record the analysis of a content opportunity.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "title": {"type": "string", "description": "Better title for content"},
+            "content_type": {"type": "string",
+                             "enum": ["blog_post", "newsletter", "case_study", "guide"]},
+            "priority": {"type": "string", "enum": ["high", "medium", "low", "needs_review"]},
+            "relevance_score": {"type": "integer", "minimum": 0, "maximum": 100,
+                                "description": "Add +20 if team asked 3+ times"},
+            "demand_score": {"type": "integer", "minimum": 0, "maximum": 100},
+            "expertise_score": {"type": "integer", "minimum": 0, "maximum": 100},
+            "search_interest": {"type": "string", "enum": ["high", "medium", "low"]},
+            "affects_services": {"type": "array", "items": {"type": "string"},
+                                 "description": "e.g. ALT2"},
+            "key_topics": {"type": "array", "items": {"type": "string"},
+                           "description": "e.g. sidewalk shed"},
+            "reasoning": {"type": "string", "description": "Why this matters"},
+            "content_angle": {"type": "string", "description": "Specific angle to cover"},
+            "review_question": {"type": "string", "description": "Question if uncertain"},
+            "most_common_angle": {
+                "type": ["string", "null"],
+                "description": "One-sentence summary of the team questions' shared concern, "
+                               "or null if none",
+            },
+            "recommended_format": {
+                "type": "string",
+                "enum": ["blog_post", "newsletter_mention", "comprehensive_guide", "case_study"],
+            },
+            "estimated_minutes": {"type": "integer"},
+        },
+        "required": ["title", "content_type", "priority", "relevance_score",
+                     "affects_services", "key_topics", "reasoning"],
+    },
+}
@@ -7,7 +7,7 @@ import json
 import logging
 import re
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterator, Optional
 
 import anthropic
 
@@ -426,6 +426,33 @@ IMPORTANT:
         """Convert Message objects to Anthropic API format."""
         return [{"role": msg.role, "content": msg.content} for msg in history]
 
+    def _build_request(
+        self,
+        user_message: str,
+        conversation_history: list[Message],
+        rag_context: Optional[str] = None,
+    ) -> tuple[str, list[dict]]:
+        """Build the system prompt and API messages for a request."""
+        system_prompt = self._build_system_prompt(user_message)
+
+        # Add RAG instructions to system prompt if context is provided
+        if rag_context:
+            system_prompt += self._build_rag_instructions()
+
+        messages = self._convert_history(conversation_history)
+
+        # Ensure the current user message is always the last message.
+        # Callers may or may not have already added it to conversation_history,
+        # so check if it's already there to avoid duplicating it.
+        if not messages or messages[-1].get("role") != "user" or messages[-1].get("content") != user_message:
+            messages.append({"role": "user", "content": user_message})
+
+        # Enhance the last user message with RAG context
+        if rag_context and messages:
+            messages = self._inject_rag_context(messages, rag_context)
+
+        return system_prompt, messages
+
     def get_response(
         self,
         user_message: str,
@@ -457,23 +484,9 @@ IMPORTANT:
         """
         try:
             model = model_override or self.settings.claude_model
-            system_prompt = self._build_system_prompt(user_message)
-
-            # Add RAG instructions to system prompt if context is provided
-            if rag_context:
-                system_prompt += self._build_rag_instructions()
-
-            messages = self._convert_history(conversation_history)
-
-            # Ensure the current user message is always the last message.
-            # Callers may or may not have already added it to conversation_history,
-            # so check if it's already there to avoid duplicating it.
-            if not messages or messages[-1].get("role") != "user" or messages[-1].get("content") != user_message:
-                messages.append({"role": "user", "content": user_message})
-
-            # Enhance the last user message with RAG context
-            if rag_context and messages:
-                messages = self._inject_rag_context(messages, rag_context)
+            system_prompt, messages = self._build_request(
+                user_message, conversation_history, rag_context
+            )
 
             logger.info(
                 f"Sending request to Claude ({model}) "
@@ -573,6 +586,89 @@ IMPORTANT:
             logger.error(f"Unexpected error getting Claude response: {e}")
             return "I apologize, but I encountered an error processing your request. Please try again.", model, {"input_tokens": 0, "output_tokens": 0}
 
+    def stream_response(
+        self,
+        user_message: str,
+        conversation_history: list[Message],
+        rag_context: Optional[str] = None,
+        model_override: Optional[str] = None,
+        max_tokens_override: Optional[int] = None,
+        temperature_override: Optional[float] = None,
+    ) -> Iterator[str]:
+        """Stream a tool-free response from Claude as raw text deltas.
+
+        Same prompt/RAG handling as get_response, but yields text as it arrives
+        instead of waiting for the full completion. Deltas are unfiltered —
+        callers run ResponseFilter.filter_response on the joined text.
+
+        Raises:
+            anthropic.APIError: If the API call fails.
+        """
+        model = model_override or self.settings.claude_model
+        system_prompt, messages = self._build_request(
+            user_message, conversation_history, rag_context
+        )
+
+        logger.info(
+            f"Streaming request to Claude ({model}) "
+            f"with {len(messages)} messages, RAG: {bool(rag_context)}"
+        )
+
+        try:
+            with self.client.messages.stream(
+                model=model,
+                max_tokens=max_tokens_override or self.settings.claude_max_tokens,
+                temperature=(temperature_override if temperature_override is not None
+                             else self.settings.claude_temperature),
+                system=system_prompt,
+                messages=messages,
+            ) as stream:
+                yield from stream.text_stream
+        except anthropic.APIError as e:
+            logger.error(f"Claude API error: {e}")
+            raise
+
+    def get_tool_input(
+        self,
+        user_message: str,
+        conversation_history: list[Message],
+        tool: dict,
+        model_override: Optional[str] = None,
+        max_tokens_override: Optional[int] = None,
+        temperature_override: Optional[float] = None,
+    ) -> dict:
+        """Force Claude to call `tool` and return the arguments it produced.
+
+        For structured output: the tool's input_schema is the reply format, and
+        the SDK hands back the arguments already parsed. Nothing is executed.
+
+        Raises:
+            anthropic.APIError: If the API call fails.
+            ValueError: If the reply contains no call to `tool`.
+        """
+        model = model_override or self.settings.claude_model
+        system_prompt, messages = self._build_request(user_message, conversation_history)
+
+        try:
+            response = self.client.messages.create(
+                model=model,
+                max_tokens=max_tokens_override or self.settings.claude_max_tokens,
+                temperature=(temperature_override if temperature_override is not None
+                             else self.settings.claude_temperature),
+                system=system_prompt,
+                messages=messages,
+                tools=[tool],
+                tool_choice={"type": "tool", "name": tool["name"]},
+            )
+        except anthropic.APIError as e:
+            logger.error(f"Claude API error: {e}")
+            raise
+
+        for block in response.content:
+            if block.type == "tool_use" and block.name == tool["name"]:
+                return block.input
+        raise ValueError(f"Claude did not call {tool['name']} (stop_reason={response.stop_reason})")
+
     def _build_rag_instructions(self) -> str:
         """Build RAG-specific instructions for the system prompt."""
         return """
@@ -72,7 +72,7 @@ def _assert_safe(url: str) -> None:
 
 
 def safe_get(url: str, *, session: "requests.Session | None" = None,
-             timeout: int = 15, headers: "dict | None" = None, **kw) -> requests.Response:
+             timeout: "float | tuple" = 15, headers: "dict | None" = None, **kw) -> requests.Response:
     """SSRF-guarded requests.get: every hop's host must resolve to a public IP.
 
     Redirects are followed manually (allow_redirects=False) so an allowed public host
@@ -4,7 +4,7 @@ Full-featured dashboard with date ranges, conversations, topics, and insights.
 Only authorized users (AUTHORIZED_EMAILS) can access.
 """
 
-from flask import render_template_string, jsonify, request, redirect, url_for, session
+from flask import current_app, render_template, jsonify, request, redirect, url_for, session
 from datetime import datetime, timedelta
 from analytics.analytics import AnalyticsDB
 import os
@@ -2357,6 +2357,19 @@ LOGIN_HTML = """
 # AUTH DECORATOR AND ROUTES
 # ============================================================================
 
+# Inline template source -> compiled Template. render_template_string re-parses
+# and re-compiles its source on every call; these pages are fixed strings.
+_compiled_templates = {}
+
+
+def _render(source: str, **context):
+    """render_template_string, but each inline template is compiled once."""
+    template = _compiled_templates.get(source)
+    if template is None:
+        template = _compiled_templates[source] = current_app.jinja_env.from_string(source)
+    return render_template(template, **context)
+
+
 def require_auth(f):
     """Decorator to require authentication for routes."""
     @wraps(f)
@@ -2390,7 +2403,7 @@ def require_auth(f):
         # Check if user is authorized
         user_email = session['user_email']
         if user_email not in AUTHORIZED_EMAILS:
-            return render_template_string(LOGIN_HTML, 
+            return _render(LOGIN_HTML, 
                 error=f"Access denied. {user_email} is not authorized.",
                 auth_url=url_for('login'))
         
@@ -2421,7 +2434,7 @@ def add_dashboard_routes(app, analytics_db: AnalyticsDB):
             f"prompt=select_account"
         )
         
-        return render_template_string(LOGIN_HTML, auth_url=auth_url, error=None)
+        return _render(LOGIN_HTML, auth_url=auth_url, error=None)
     
     @app.route("/auth/callback")
     def auth_callback():
@@ -2452,7 +2465,7 @@ def add_dashboard_routes(app, analytics_db: AnalyticsDB):
             token_json = token_response.json()
             
             if 'id_token' not in token_json:
-                return render_template_string(LOGIN_HTML, 
+                return _render(LOGIN_HTML, 
                     error="Authentication failed. Please try again.",
                     auth_url=url_for('login'))
             
@@ -2470,14 +2483,14 @@ def add_dashboard_routes(app, analytics_db: AnalyticsDB):
             
             # Check if authorized
             if user_email not in AUTHORIZED_EMAILS:
-                return render_template_string(LOGIN_HTML,
+                return _render(LOGIN_HTML,
                     error=f"Access denied. {user_email} is not authorized to access this dashboard.",
                     auth_url=url_for('login'))
             
             return redirect(url_for('dashboard'))
             
         except Exception as e:
-            return render_template_string(LOGIN_HTML,
+            return _render(LOGIN_HTML,
                 error=f"Authentication error: {str(e)}",
                 auth_url=url_for('login'))
     
@@ -2492,7 +2505,7 @@ def add_dashboard_routes(app, analytics_db: AnalyticsDB):
     def dashboard():
         """Main dashboard page (OAuth protected)."""
         user_email = session.get('user_email', 'Unknown')
-        return render_template_string(DASHBOARD_V2_HTML, user_email=user_email, active_page='analytics', page_title='Analytics')
+        return _render(DASHBOARD_V2_HTML, user_email=user_email, active_page='analytics', page_title='Analytics')
     
 
     @app.route("/conversations")
@@ -2500,7 +2513,7 @@ def add_dashboard_routes(app, analytics_db: AnalyticsDB):
     def conversations():
         """Conversations page."""
         convs = analytics_db.get_recent_conversations(limit=100)
-        return render_template_string(CONVERSATIONS_PAGE,
+        return _render(CONVERSATIONS_PAGE,
             active_page='conversations',
             page_title='Conversations',
             conversations=convs)
@@ -2511,7 +2524,7 @@ def add_dashboard_routes(app, analytics_db: AnalyticsDB):
         """Feedback page."""
         suggestions = analytics_db.get_pending_suggestions()
         approved_suggestions = analytics_db.get_approved_corrections(limit=50)
-        return render_template_string(FEEDBACK_PAGE,
+        return _render(FEEDBACK_PAGE,
             active_page='feedback',
             page_title='Feedback',
             suggestions=suggestions,
@@ -2528,7 +2541,7 @@ def add_dashboard_routes(app, analytics_db: AnalyticsDB):
         except Exception as e:
             logger.error(f"Error getting roadmap: {e}")
             roadmap = {"by_status": {}, "items": []}
-        return render_template_string(ROADMAP_PAGE,
+        return _render(ROADMAP_PAGE,
             active_page='roadmap',
             page_title='Roadmap',
             roadmap=roadmap)
@@ -2537,7 +2550,7 @@ def add_dashboard_routes(app, analytics_db: AnalyticsDB):
     @require_auth
     def knowledge_base_page():
         """Knowledge Base page."""
-        return render_template_string(KNOWLEDGE_BASE_PAGE,
+        return _render(KNOWLEDGE_BASE_PAGE,
             active_page='knowledge',
             page_title='Knowledge Base')
 
@@ -1164,9 +1164,9 @@ Type: {source_type}
                 processor = DocumentProcessor()
             except Exception:
                 return count
-            for url in page_links[:15]:
+            page_links = page_links[:15]
+            for url, (content, links) in zip(page_links, parser.fetch_pages(page_links)):
                 try:
-                    content, links = parser._fetch_page_content(url)
                     if content and len(content) > 200:
                         document = processor.process_text(
                             text=content,
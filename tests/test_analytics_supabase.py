@@ -0,0 +1,47 @@
+"""
+Unit tests for the Supabase (edge function) analytics backend.
+"""
+
+import pytest
+
+from analytics.analytics_supabase import SupabaseAnalyticsDB
+
+
+@pytest.fixture
+def db():
+    return SupabaseAnalyticsDB("https://example.supabase.co", "key")
+
+
+class TestGetContentCandidate:
+    """Tests for the by-id candidate lookup and its scan fallback."""
+
+    def _answer(self, db, by_id):
+        """Route edge-function calls: by_id answers the by-id action, the listing
+        returns one candidate. Returns the list of actions called."""
+        calls = []
+
+        def fake_call(action, data=None):
+            calls.append(action)
+            if action == "get_content_candidate":
+                return by_id
+            return [{"id": "c1", "title": "Sheds"}]
+
+        db._call = fake_call
+        return calls
+
+    def test_by_id_answer_is_used_without_scanning(self, db):
+        """A found row and a genuine "not found" both come from the single call."""
+        calls = self._answer(db, {"candidate": {"id": "c1", "title": "Sheds"}})
+        assert db.get_content_candidate("c1") == {"id": "c1", "title": "Sheds"}
+        assert calls == ["get_content_candidate"]
+        calls = self._answer(db, {"candidate": None})
+        assert db.get_content_candidate("c1") is None
+        assert calls == ["get_content_candidate"]
+
+    def test_unsupported_action_falls_back_and_is_remembered(self, db):
+        """After the by-id action fails, lookups go straight to the scan."""
+        calls = self._answer(db, {"error": "Unknown action: get_content_candidate"})
+        assert db.get_content_candidate("c1") == {"id": "c1", "title": "Sheds"}
+        assert db.get_content_candidate("missing") is None
+        assert calls == ["get_content_candidate", "get_content_candidates",
+                         "get_content_candidates"]
@@ -0,0 +1,539 @@
+"""
+Unit tests for the content intelligence engine.
+"""
+
+import sqlite3
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from content_engine.engine import _CANDIDATE_COLUMNS, ContentCandidate, ContentEngine
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """ContentEngine on a temp SQLite store, with Claude/retriever mocked and
+    Supabase disabled."""
+    monkeypatch.setattr(ContentEngine, "analytics_db", property(lambda self: None))
+    with patch("content_engine.engine.ClaudeClient"), \
+            patch("content_engine.engine.Retriever"):
+        eng = ContentEngine(db_path=str(tmp_path / "content.db"))
+    return eng
+
+
+class TestTeamQuestionKeywords:
+    """Tests for keyword extraction in _check_team_questions."""
+
+    def test_keywords_skip_stopwords_and_dedupe(self, engine):
+        """Filler words are dropped and repeated words only count once."""
+        seen = {}
+
+        def fake_query(keywords, days):
+            seen["keywords"] = keywords
+            return []
+
+        engine._query_team_questions_supabase = fake_query
+        engine._check_team_questions(
+            "Sidewalk shed update",
+            "These sidewalk sheds would require permits which expire.",
+        )
+        assert seen["keywords"] == ["sidewalk", "sheds", "require", "permits", "expire"]
+
+    def test_repeated_notice_is_cached(self, engine):
+        """The same notice reuses the first lookup; a different notice sharing its
+        keywords gets its own semantic match."""
+        calls = []
+
+        def fake_query(keywords, days):
+            calls.append(keywords)
+            return [("How long do sidewalk sheds stay up?", "pm")]
+
+        engine._query_team_questions_supabase = fake_query
+        engine._semantic_filter = lambda notice, pairs, threshold, top_k: pairs
+        first = engine._check_team_questions("Sidewalk sheds", "Permits expire")
+        second = engine._check_team_questions("Sidewalk sheds", "Permits expire")
+        assert first == second
+        assert first["count"] == 1
+        assert len(calls) == 1
+        engine._check_team_questions("Permits expire", "sidewalk sheds")
+        assert len(calls) == 2
+
+    def test_users_deduped_in_first_seen_order(self, engine):
+        """Each asker is listed once, in the order their questions matched."""
+        engine._query_team_questions_supabase = lambda keywords, days: [
+            ("Sidewalk shed permit?", "Zoe"), ("Shed renewal?", "Adam"),
+            ("Sidewalk shed fees?", "Zoe"),
+        ]
+        engine._semantic_filter = lambda notice, pairs, threshold, top_k: pairs
+        result = engine._check_team_questions("Sidewalk sheds", "Renewals")
+        assert result["users"] == ["Zoe", "Adam"]
+        assert result["count"] == 3
+
+
+class TestSqliteCandidates:
+    """Tests for the SQLite candidate store."""
+
+    def _candidate(self, **overrides):
+        fields = dict(
+            id="cand_test", title="Sidewalk shed permits", content_type="blog_post",
+            priority="high", relevance_score=80, key_topics=["sidewalk shed"],
+            team_questions=["How long is a shed permit?"], team_questions_count=1,
+            created_at="2026-01-01T00:00:00",
+        )
+        fields.update(overrides)
+        return ContentCandidate(**fields)
+
+    def test_save_and_get_round_trip(self, engine):
+        """A saved candidate reads back with its JSON list columns decoded."""
+        engine._save_candidate(self._candidate())
+        got = engine._get_candidate("cand_test")
+        assert got.title == "Sidewalk shed permits"
+        assert got.key_topics == ["sidewalk shed"]
+        assert got.team_questions == ["How long is a shed permit?"]
+        assert got.affects_services == []
+        assert got.status == "pending"
+
+    def test_null_or_corrupt_list_columns_read_as_empty(self, engine):
+        """NULL (pre-migration rows) and malformed JSON list columns decode to []."""
+        engine._save_candidate(self._candidate())
+        with engine._sqlite_cursor() as c:
+            c.execute("UPDATE content_candidates SET key_topics = NULL, "
+                      "team_questions = '[oops'")
+        got = engine._get_candidate("cand_test")
+        assert got.key_topics == [] and got.team_questions == []
+
+    def test_persistent_connection_uses_wal_and_reopens(self, engine):
+        """The engine keeps one WAL connection, and reopens it after close()."""
+        with engine._sqlite_cursor() as c:
+            assert c.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        conn = engine._sqlite
+        engine._save_candidate(self._candidate())
+        assert engine._sqlite is conn
+        engine.close()
+        assert engine._get_candidate("cand_test").title == "Sidewalk shed permits"
+
+    def test_save_candidates_bulk(self, engine):
+        """save_candidates writes every row in one call."""
+        engine.save_candidates([self._candidate(id=f"cand_{i}", relevance_score=i)
+                                for i in range(3)])
+        assert [c.id for c in engine._get_candidates_sqlite()] == ["cand_2", "cand_1", "cand_0"]
+        assert engine._get_candidate("cand_1").key_topics == ["sidewalk shed"]
+
+    def test_pending_topics_only_from_pending(self, engine):
+        """Pending candidates' key_topics come back lowercased and deduplicated."""
+        engine.save_candidates([
+            self._candidate(id="cand_a", key_topics=["Zoning", "sidewalk shed"]),
+            self._candidate(id="cand_b", key_topics=["zoning"]),
+            self._candidate(id="cand_c", key_topics=["DHCR"], status="approved"),
+        ])
+        assert engine.get_pending_topics() == {"zoning", "sidewalk shed"}
+
+    def test_supabase_payload_keeps_lists(self, engine, monkeypatch):
+        """The Supabase save gets every column, with list fields as lists."""
+        fake_db = MagicMock()
+        monkeypatch.setattr(ContentEngine, "analytics_db", property(lambda self: fake_db))
+        engine._save_candidate(self._candidate())
+        payload = fake_db.save_content_candidate.call_args[0][0]
+        assert set(payload) == set(_CANDIDATE_COLUMNS)
+        assert payload["key_topics"] == ["sidewalk shed"]
+        assert payload["affects_services"] == []
+
+    def test_pending_query_uses_index_without_sort(self, engine):
+        """The pending listing is served from an index, with no temp B-tree sort."""
+        conn = sqlite3.connect(engine.db_path)
+        for sql in (
+            "SELECT id FROM content_candidates WHERE status = 'pending' "
+            "ORDER BY relevance_score DESC",
+            "SELECT id FROM content_candidates WHERE status = 'pending' "
+            "AND priority = 'high' ORDER BY relevance_score DESC",
+        ):
+            plan = " ".join(r[-1] for r in conn.execute(f"EXPLAIN QUERY PLAN {sql}"))
+            assert "USING INDEX idx_cc_status" in plan
+            assert "TEMP B-TREE" not in plan
+        conn.close()
+
+    def test_drafts_listed_newest_first_from_index(self, engine):
+        """Local drafts come back newest first, read through the status index."""
+        engine._save_generated("gen_old", "c1", "blog_post", "Old", "a b", 2)
+        engine._save_generated("gen_new", "c2", "newsletter", "New", "c d e", 3)
+        assert [d["id"] for d in engine.get_drafts()] == ["gen_new", "gen_old"]
+
+        conn = sqlite3.connect(engine.db_path)
+        plan = " ".join(r[-1] for r in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM generated_content WHERE status = 'draft' "
+            "ORDER BY generated_at DESC LIMIT 20"))
+        conn.close()
+        assert "USING INDEX idx_gc_status_generated" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_set_candidate_status_updates_local_row(self, engine):
+        """A status change is written and visible to the next listing."""
+        engine._save_candidate(self._candidate())
+        assert [c.id for c in engine.get_pending_candidates()] == ["cand_test"]
+        engine.set_candidate_status("cand_test", "skipped")
+        assert engine.get_pending_candidates() == []
+        assert engine._get_candidate("cand_test").status == "skipped"
+
+    def test_bulk_status_change_applies_every_row(self, engine):
+        """A batch of decisions lands in one call."""
+        for cid in ("cand_a", "cand_b", "cand_c"):
+            engine._save_candidate(self._candidate(id=cid))
+        engine.set_candidate_statuses([("cand_a", "skipped"), ("cand_c", "published")])
+        assert [c.id for c in engine.get_pending_candidates()] == ["cand_b"]
+        assert engine._get_candidate("cand_c").status == "published"
+
+    def test_raw_pending_rows_match_candidates(self, engine):
+        """The dashboard's raw rows carry the same values as the full candidates."""
+        engine._save_candidate(self._candidate())
+        with engine._sqlite_cursor() as c:
+            c.execute("UPDATE content_candidates SET search_interest = NULL")
+        raw = engine.get_pending_candidates_raw()
+        full = engine.get_pending_candidates()
+        assert raw == [{col: getattr(c, col) for col in raw[0]} for c in full]
+        assert raw[0]["search_interest"] == "unknown"
+
+    def test_pending_filter_binds_priority(self, engine):
+        """Priority is bound as a parameter, so quotes can't alter the query."""
+        engine._save_candidate(self._candidate())
+        engine._save_candidate(self._candidate(id="cand_low", priority="low",
+                                               relevance_score=20))
+        assert [c.id for c in engine._get_candidates_sqlite()] == ["cand_test", "cand_low"]
+        assert [c.id for c in engine._get_candidates_sqlite(priority="low")] == ["cand_low"]
+        assert engine._get_candidates_sqlite(priority="x' OR '1'='1") == []
+
+
+class TestDraftGeneration:
+    """Tests for streamed draft generation."""
+
+    def test_newsletter_streams_and_saves_draft(self, engine):
+        """Streamed deltas are joined, filtered once, and saved with a word count."""
+        engine.retriever.retrieve.return_value = MagicMock(context="ctx", sources=[])
+        engine.claude.stream_response.return_value = iter(["Sidewalk sheds ", "now need ", "permits."])
+        engine.claude.filter.filter_response.side_effect = lambda text: text
+        candidate = ContentCandidate(id="cand_nl", title="Sheds", content_type="newsletter",
+                                     priority="medium", relevance_score=50)
+
+        content = engine.generate_newsletter("cand_nl", candidate=candidate)
+
+        assert content == "Sidewalk sheds now need permits."
+        engine.claude.filter.filter_response.assert_called_once_with(content)
+        engine.flush()
+        conn = sqlite3.connect(engine.db_path)
+        row = conn.execute("SELECT content, word_count FROM generated_content").fetchone()
+        conn.close()
+        assert row == (content, 5)
+
+    def test_last_generation_stats_are_per_thread(self, engine):
+        """Concurrent generations each read back their own word count."""
+        engine.retriever.retrieve.return_value = MagicMock(context="ctx", sources=[])
+        engine.claude.stream_response.return_value = iter(["Three word draft."])
+        engine.claude.filter.filter_response.side_effect = lambda text: text
+        candidate = ContentCandidate(id="cand_nl", title="Sheds", content_type="newsletter",
+                                     priority="medium", relevance_score=50)
+        engine.generate_newsletter("cand_nl", candidate=candidate)
+
+        seen = []
+        worker = threading.Thread(target=lambda: seen.append(engine._last_word_count))
+        worker.start()
+        worker.join()
+
+        assert engine._last_word_count == 3
+        assert seen == [None]
+
+    def test_regenerating_reuses_cached_retrieval(self, engine):
+        """A second draft for the same candidate skips the KB retrieval."""
+        engine.retriever.retrieve.return_value = MagicMock(context="ctx", sources=[])
+        engine.claude.stream_response.side_effect = lambda **kw: iter(["Draft text."])
+        engine.claude.filter.filter_response.side_effect = lambda text: text
+        candidate = ContentCandidate(id="cand_nl", title="Sheds", content_type="newsletter",
+                                     priority="medium", relevance_score=50)
+
+        engine.generate_newsletter("cand_nl", candidate=candidate)
+        engine.generate_newsletter("cand_nl", candidate=candidate)
+
+        engine.retriever.retrieve.assert_called_once()
+
+    def test_blog_prompt_fills_candidate_fields(self, engine):
+        """The blog template carries the candidate's questions and low-coverage flag."""
+        engine.retriever.retrieve.return_value = MagicMock(context="ctx", sources=[])
+        engine.claude.stream_response.return_value = iter(["Draft."])
+        engine.claude.filter.filter_response.side_effect = lambda text: text
+        candidate = ContentCandidate(id="cand_b", title="Sheds", content_type="blog_post",
+                                     priority="high", relevance_score=90,
+                                     key_topics=["sidewalk shed"],
+                                     team_questions=["How long do shed permits last?"])
+
+        engine.generate_blog_post("cand_b", candidate=candidate,
+                                  low_confidence_topics=["Sidewalk Shed"])
+
+        prompt = engine.claude.stream_response.call_args.kwargs["user_message"]
+        assert "- How long do shed permits last?" in prompt
+        assert "SEO keyword: sidewalk shed" in prompt
+        assert "LOW knowledge-base coverage" in prompt
+        assert "$" not in prompt
+
+    def test_draft_save_failure_does_not_fail_generation(self, engine):
+        """The draft is returned even if the background save raises."""
+        engine.retriever.retrieve.return_value = MagicMock(context="ctx", sources=[])
+        engine.claude.stream_response.return_value = iter(["Draft."])
+        engine.claude.filter.filter_response.side_effect = lambda text: text
+        engine._save_generated = MagicMock(side_effect=sqlite3.OperationalError("locked"))
+        candidate = ContentCandidate(id="cand_nl", title="Sheds", content_type="newsletter",
+                                     priority="medium", relevance_score=50)
+
+        assert engine.generate_newsletter("cand_nl", candidate=candidate) == "Draft."
+        engine.flush()
+        engine._save_generated.assert_called_once()
+
+
+class TestSummarizeEmail:
+    """Tests for _summarize_email."""
+
+    def test_empty_body_skips_claude(self, engine):
+        """An email with no body falls back to its subject without a Claude call."""
+        assert engine._summarize_email("Shed permit question", "  ", "pm@example.com") \
+            == "Shed permit question"
+        engine.claude.get_response.assert_not_called()
+
+
+class TestAnalysisCall:
+    """Tests for the structured analysis call."""
+
+    def test_analysis_uses_forced_tool(self, engine):
+        """The analysis comes back as the emit_analysis tool input, unparsed."""
+        engine.claude.get_tool_input.return_value = {"title": "Sheds", "priority": "high"}
+        result = engine._analyze_with_claude("t", "s", {})
+        assert result == {"title": "Sheds", "priority": "high"}
+        assert engine.claude.get_tool_input.call_args.kwargs["tool"]["name"] == "emit_analysis"
+
+    def test_failed_call_falls_back_to_review(self, engine):
+        """An API failure yields a needs_review stub instead of raising."""
+        engine.claude.get_tool_input.side_effect = RuntimeError("overloaded")
+        result = engine._analyze_with_claude("Sheds", "s", {})
+        assert result["priority"] == "needs_review"
+        assert result["title"] == "Sheds"
+
+
+class TestContentCandidate:
+    """Tests for the ContentCandidate record."""
+
+    def test_candidate_is_slotted(self):
+        """Candidates carry no per-instance __dict__ and still convert via asdict."""
+        from dataclasses import asdict
+        c = ContentCandidate(id="c1", title="t", content_type="guide",
+                             priority="low", relevance_score=10)
+        assert not hasattr(c, "__dict__")
+        assert asdict(c)["title"] == "t"
+
+    def test_supabase_row_maps_known_columns(self, engine):
+        """Unknown keys are ignored; missing fields get the usual defaults."""
+        c = engine._dict_to_candidate({"id": "c1", "title": "Sheds", "status": "drafted",
+                                       "key_topics": ["sidewalk shed"], "updated_at": "x"})
+        assert (c.id, c.title, c.status, c.key_topics) == ("c1", "Sheds", "drafted",
+                                                           ["sidewalk shed"])
+        assert (c.priority, c.relevance_score, c.search_interest) == ("medium", 50, "unknown")
+        assert c.affects_services == [] and c.team_questions == []
+
+
+class TestTeamQuestionFallback:
+    """Tests for the SQLite fallback in _check_team_questions."""
+
+    def test_missing_analytics_db_is_not_created(self, engine, tmp_path, monkeypatch):
+        """With no Supabase batch and no local analytics DB, nothing is opened."""
+        monkeypatch.chdir(tmp_path)
+        engine._query_team_questions_supabase = lambda keywords, days: None
+        assert engine._check_team_questions("Sidewalk sheds", "Permits expire") == {"count": 0}
+        assert not (tmp_path / "beacon_analytics.db").exists()
+
+    def test_sqlite_lookup_uses_question_fts(self, engine, tmp_path, monkeypatch):
+        """The local fallback finds questions through the FTS index, by prefix."""
+        from analytics.analytics import AnalyticsDB
+        monkeypatch.chdir(tmp_path)
+        AnalyticsDB("beacon_analytics.db")
+        conn = sqlite3.connect("beacon_analytics.db")
+        for q in ("Do sidewalk sheds need a new permit?", "What is a TR1?"):
+            conn.execute(
+                "INSERT INTO interactions (timestamp, user_id, user_name, question, answered) "
+                "VALUES (datetime('now'), 'u1', 'pm', ?, 1)", (q,))
+        conn.commit()
+        conn.close()
+        assert engine._query_team_questions_sqlite(["sidewalk", "shed"], 60) == [
+            ("Do sidewalk sheds need a new permit?", "pm")]
+
+    def test_analytics_connection_reused_until_close(self, engine, tmp_path, monkeypatch):
+        """Repeated lookups share one analytics connection; close() drops it."""
+        monkeypatch.chdir(tmp_path)
+        sqlite3.connect("beacon_analytics.db").execute(
+            "CREATE TABLE interactions (question TEXT, user_name TEXT, timestamp TEXT)")
+        engine._query_team_questions_sqlite(["shed"], 60)
+        conn = engine._analytics_sqlite
+        engine._query_team_questions_sqlite(["permit"], 60)
+        assert engine._analytics_sqlite is conn
+        engine.close()
+        assert engine._analytics_sqlite is None
+
+    def test_query_analytics_needs_the_db(self, engine, tmp_path, monkeypatch):
+        """No analytics DB means None (and no file created); otherwise the rows."""
+        monkeypatch.chdir(tmp_path)
+        assert engine.query_analytics("SELECT 1") is None
+        assert not (tmp_path / "beacon_analytics.db").exists()
+        sqlite3.connect("beacon_analytics.db").execute("CREATE TABLE t (x)")
+        assert engine.query_analytics("SELECT ? + 1", (1,)) == [(2,)]
+
+    def test_keyword_lookup_binds_keywords_and_window(self, engine, tmp_path, monkeypatch):
+        """Keywords and the day window are bound parameters."""
+        monkeypatch.chdir(tmp_path)
+        conn = sqlite3.connect("beacon_analytics.db")
+        conn.execute("CREATE TABLE interactions (question TEXT, user_name TEXT, timestamp TEXT)")
+        conn.executemany("INSERT INTO interactions VALUES (?, ?, datetime('now', ?))", [
+            ("Do sidewalk sheds need permits?", "A", "-1 days"),
+            ("Old sidewalk question", "B", "-90 days"),
+            ("Unrelated", "C", "-1 days"),
+        ])
+        conn.commit()
+        conn.close()
+
+        rows = engine._query_team_questions_sqlite(["sidewalk", "o'brien"], 60)
+        assert rows == [("Do sidewalk sheds need permits?", "A")]
+
+
+class TestBatchAnalysis:
+    """Tests for analyze_updates and generate_drafts."""
+
+    def test_results_keep_input_order_and_isolate_failures(self, engine):
+        """Candidates come back in input order; a failing item yields None."""
+        def fake_analyze(title, summary, source_url, source_type="newsletter"):
+            if title == "bad":
+                raise RuntimeError("boom")
+            return title
+
+        engine.analyze_update = fake_analyze
+        items = [{"title": t, "summary": "s", "source_url": "u"} for t in ("a", "bad", "c")]
+        assert engine.analyze_updates(items, concurrency=3) == ["a", None, "c"]
+
+    def test_drafts_keep_input_order_and_isolate_failures(self, engine):
+        """Each draft carries its own stats; a failing candidate reports its error."""
+        def fake_newsletter(candidate_id):
+            if candidate_id == "bad":
+                raise ValueError("Candidate bad not found")
+            engine._last_word_count = len(candidate_id)
+            engine._last_grounding = {"grounding_score": 1.0}
+            return f"draft {candidate_id}"
+
+        engine.generate_newsletter = fake_newsletter
+        results = engine.generate_drafts(["a", "bad", "ccc"], content_type="newsletter",
+                                         concurrency=3)
+        assert results == [
+            {"id": "a", "content": "draft a", "word_count": 1,
+             "grounding": {"grounding_score": 1.0}},
+            {"id": "bad", "error": "Candidate bad not found"},
+            {"id": "ccc", "content": "draft ccc", "word_count": 3,
+             "grounding": {"grounding_score": 1.0}},
+        ]
+
+
+class TestAnalyzeUpdate:
+    """Tests for analyze_update."""
+
+    def test_single_claude_call_sets_angle(self, engine):
+        """Team questions go into the analysis prompt; the angle comes back from it."""
+        engine._check_team_questions = lambda title, summary: {
+            "count": 2, "questions": ["Do sheds need permits?", "How long do shed permits last?"],
+            "users": ["A"],
+        }
+        engine.claude.get_tool_input.return_value = {
+            "title": "Shed permits", "priority": "high", "relevance_score": 80,
+            "most_common_angle": "Permit duration",
+        }
+
+        candidate = engine.analyze_update("Sheds", "New shed rules", "https://example.com")
+
+        engine.claude.get_tool_input.assert_called_once()
+        prompt = engine.claude.get_tool_input.call_args.kwargs["user_message"]
+        assert "- How long do shed permits last?" in prompt
+        assert candidate.most_common_angle == "Permit duration"
+        assert candidate.team_questions_count == 2
+
+
+class TestSupabaseBackend:
+    """Tests for the lazy Supabase backend load."""
+
+    def test_failed_load_is_not_retried_immediately(self, tmp_path):
+        """After a failed load, use_supabase answers without re-initializing."""
+        with patch("content_engine.engine.ClaudeClient"), \
+                patch("content_engine.engine.Retriever"):
+            eng = ContentEngine(db_path=str(tmp_path / "content.db"))
+        with patch("analytics.analytics_supabase.SupabaseAnalyticsDB",
+                   side_effect=RuntimeError("down")) as backend:
+            assert eng.use_supabase is False
+            assert eng.use_supabase is False
+        assert backend.call_count == 1
+
+
+class TestReadCache:
+    """Tests for the dashboard read cache."""
+
+    def test_reads_are_cached_until_a_write(self, engine):
+        """Repeated listings hit the store once; a save invalidates them."""
+        calls = []
+        real = engine._get_candidates_sqlite
+
+        def counting(*args, **kwargs):
+            calls.append(args)
+            return real(*args, **kwargs)
+
+        engine._get_candidates_sqlite = counting
+        assert engine.get_pending_candidates() == []
+        assert engine.get_pending_candidates() == []
+        assert len(calls) == 1
+
+        engine._save_candidate(ContentCandidate(id="c1", title="t", content_type="guide",
+                                                priority="low", relevance_score=10))
+        assert [c.id for c in engine.get_pending_candidates()] == ["c1"]
+        assert len(calls) == 2
+
+    def test_read_during_write_is_not_kept(self, engine, monkeypatch):
+        """A listing read while a status change is in flight isn't served after it."""
+        rows = [{"id": "c1", "title": "t", "content_type": "guide", "priority": "low",
+                 "relevance_score": 10, "status": "pending"}]
+        fake_db = MagicMock()
+        fake_db.get_content_candidates.side_effect = lambda **kw: [
+            dict(r) for r in rows if r["status"] == "pending"]
+
+        def slow_update(candidate_id, status):
+            assert [c.id for c in engine.get_pending_candidates()] == ["c1"]
+            rows[0]["status"] = status
+
+        fake_db.update_content_candidate.side_effect = slow_update
+        monkeypatch.setattr(ContentEngine, "analytics_db", property(lambda self: fake_db))
+        engine.set_candidate_status("c1", "skipped")
+        assert engine.get_pending_candidates() == []
+
+
+class TestJobs:
+    """Tests for the shared background-job state."""
+
+    def test_running_job_is_shared_across_engines(self, engine, tmp_path):
+        """A second worker joins the running job, sees its result, then can start anew."""
+        with patch("content_engine.engine.ClaudeClient"), \
+                patch("content_engine.engine.Retriever"):
+            other = ContentEngine(db_path=engine.db_path)
+        job_id, started = engine.start_job("auto_generate", stale_after=60)
+        assert started
+        assert other.start_job("auto_generate", stale_after=60) == (job_id, False)
+        assert other.get_job(job_id)["status"] == "running"
+
+        engine.finish_job(job_id, {"success": True, "candidates_created": 2})
+        job = other.get_job(job_id)
+        assert (job["status"], job["result"]) == ("done", {"success": True,
+                                                           "candidates_created": 2})
+        new_id, started = other.start_job("auto_generate", stale_after=60)
+        assert started and new_id != job_id
+        assert other.get_job("nope") is None
+
+    def test_stale_running_job_is_superseded(self, engine):
+        """A job left running by a dead worker doesn't block new runs forever."""
+        job_id, _ = engine.start_job("auto_generate", stale_after=60)
+        new_id, started = engine.start_job("auto_generate", stale_after=0)
+        assert started and new_id != job_id
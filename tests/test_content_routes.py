@@ -0,0 +1,109 @@
+"""
+Unit tests for the content intelligence routes.
+"""
+
+import io
+import json
+import sqlite3
+from collections import defaultdict
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask
+
+import analytics.content_routes as content_routes
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Test client for the content blueprint, with OAuth off and the engine mocked."""
+    monkeypatch.delenv("GOOGLE_CLIENT_ID", raising=False)
+    engine = MagicMock()
+    monkeypatch.setattr(content_routes, "get_engine", lambda: engine)
+    app = Flask(__name__)
+    app.register_blueprint(content_routes.content_bp)
+    client = app.test_client()
+    client.engine = engine
+    return client
+
+
+class TestBodySizeLimit:
+    """Tests for the request body cap."""
+
+    def _decide(self, client, body, chunked):
+        if not chunked:
+            return client.post("/api/content/decide", data=body,
+                               content_type="application/json")
+        return client.post("/api/content/decide", input_stream=io.BytesIO(body),
+                           content_type="application/json",
+                           headers={"Transfer-Encoding": "chunked"},
+                           environ_overrides={"wsgi.input_terminated": True})
+
+    @pytest.mark.parametrize("chunked", [False, True])
+    def test_oversized_body_rejected(self, client, chunked):
+        """Bodies over the cap get a 413, whether or not they declare a length."""
+        body = json.dumps({"candidate_id": "x" * (content_routes._MAX_POST_BYTES + 1)})
+        response = self._decide(client, body.encode(), chunked)
+        assert response.status_code == 413
+        assert response.json == {"success": False, "error": "Request body too large"}
+        client.engine.set_candidate_status.assert_not_called()
+
+    def test_chunked_body_under_cap_reaches_route(self, client):
+        """A chunked body within the cap is read once and parsed as usual."""
+        body = json.dumps({"candidate_id": "c1", "decision": "skip"}).encode()
+        response = self._decide(client, body, chunked=True)
+        assert response.status_code == 200
+        client.engine.set_candidate_status.assert_called_once_with("c1", "skipped")
+
+
+class TestAutoGenerateTopics:
+    """Tests for auto-generate topic bucketing."""
+
+    def test_sql_grouping_matches_detect_topic(self):
+        """The SQLite CASE/window query buckets questions exactly like _detect_topic."""
+        questions = [f"How does {kw.upper()} apply here?"
+                     for keywords in content_routes._AUTO_GEN_TOPICS.values()
+                     for kw in keywords]
+        # Multi-topic questions (first match wins) and unmatched ones.
+        questions += ["Rent stabilized building with an ECB violation",
+                      "Egress plan for a Class A MDL building", "hello", "thanks!"]
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE interactions (id INTEGER PRIMARY KEY, question TEXT)")
+        conn.executemany("INSERT INTO interactions (question) VALUES (?)",
+                         [(q,) for q in questions] + [(None,)])
+
+        counts, samples = {}, defaultdict(list)
+        for topic, count, question in conn.execute(content_routes._TOPIC_GROUPS_SQL,
+                                                   content_routes._TOPIC_CASE_PARAMS):
+            counts[topic] = count
+            samples[topic].append(question)
+        conn.close()
+
+        expected = defaultdict(list)
+        for q in questions:
+            expected[content_routes._detect_topic(q)].append(q)
+        assert counts == {topic: len(qs) for topic, qs in expected.items()}
+        assert samples == {topic: qs[:content_routes._TOPIC_SAMPLE]
+                           for topic, qs in expected.items()}
+
+    def test_sqlite_fallback_creates_candidates_per_topic(self, monkeypatch):
+        """Without Supabase, topics with 2+ local questions become candidates."""
+        monkeypatch.delenv("SUPABASE_URL", raising=False)
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE interactions (id INTEGER PRIMARY KEY, question TEXT)")
+        conn.executemany("INSERT INTO interactions (question) VALUES (?)", [
+            ("How long does a zoning variance take?",), ("Zoning setback rules?",),
+            ("DOB permit status?",), ("hello",)])
+        engine = MagicMock()
+        engine.query_analytics.side_effect = lambda sql, params: conn.execute(
+            sql, params).fetchall()
+        engine.get_pending_topics.return_value = set()
+
+        result = content_routes.run_auto_generate(engine)
+
+        assert (result["success"], result["source"], result["candidates_created"]) == (
+            True, "sqlite", 1)
+        (candidate,), = engine.save_candidates.call_args.args
+        assert candidate.key_topics == ["Zoning"]
+        assert candidate.team_questions_count == 2
+        assert candidate.most_common_angle == "Timeline concerns"
@@ -82,6 +82,22 @@ class TestClaudeClient:
         assert client._is_dhcr_related("How do I file for a rent overcharge?")
         assert client._is_dhcr_related("MCI increase questions")
 
+    def test_get_tool_input_returns_forced_tool_arguments(self, mock_settings):
+        """The forced tool call's input comes back as a dict."""
+        with patch("core.llm_client.anthropic.Anthropic"):
+            client = ClaudeClient(mock_settings)
+        block = MagicMock(type="tool_use", input={"title": "Sheds"})
+        block.name = "emit_analysis"
+        client.client.messages.create.return_value = MagicMock(content=[block])
+        tool = {"name": "emit_analysis", "input_schema": {"type": "object"}}
+
+        result = client.get_tool_input("Analyze", [Message(role="user", content="Analyze")], tool)
+
+        assert result == {"title": "Sheds"}
+        kwargs = client.client.messages.create.call_args.kwargs
+        assert kwargs["tools"] == [tool]
+        assert kwargs["tool_choice"] == {"type": "tool", "name": "emit_analysis"}
+
     def test_is_dhcr_related_negative(self, mock_settings):
         """Test DHCR detection with unrelated text."""
         with patch("llm_client.get_settings", return_value=mock_settings):
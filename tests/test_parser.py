@@ -0,0 +1,214 @@
+"""
+Unit tests for the DOB newsletter parser.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from content_engine.parser import DOBNewsletterParser
+
+GOVDELIVERY_EMAIL = """<html><head><title>Buildings News</title></head><body>
+<table><tr><td><font style="font-size: 43pt">Buildings news</font></td></tr>
+<tr><td>July 2,
+\t\t2026</td></tr>
+<tr><td><font style="font-size: 16pt; color: #003399">Sidewalk Shed Permits Now Expire After 90 Days</font>
+<p>Starting this month, the Department requires sidewalk shed permits to be renewed every 90 days.
+<a href="https://links.govdelivery.com/track?abc">Read the service notice</a></p></td></tr>
+<tr><td><hr/></td></tr>
+<tr><td><font style="font-size: 16pt; color: #204496">Local Laws</font>
+<p>Local Law 97 compliance reports for covered buildings are due by May 1 each year going forward.</p>
+</td></tr>
+<tr><td><font style="font-size: 16pt">Unsubscribe</font>
+<p>Manage your subscription or unsubscribe from these emails at any time here.</p></td></tr>
+</table></body></html>"""
+
+LEGACY_EMAIL = """<html><body><p>Posted 07/02/2026</p>
+<h2>Service Updates</h2>
+<ul><li><a href="/site/buildings/news/shed.page">Shed renewals</a> - sheds renew every 90 days</li>
+<li>No link here</li></ul>
+<h2>Local Laws</h2>
+<p><a href="https://www.nyc.gov/ll97.page">LL97 reports</a> are due May 1.</p>
+</body></html>"""
+
+
+@pytest.fixture
+def parser(monkeypatch):
+    import content_engine.parser as parser_module
+    monkeypatch.setattr(parser_module, "_parse_cache", parser_module.OrderedDict())
+    return DOBNewsletterParser()
+
+
+class TestParseEmail:
+    """Tests for DOBNewsletterParser.parse_email."""
+
+    def test_govdelivery_stories(self, parser):
+        """16pt headings start updates; the masthead and boilerplate are dropped."""
+        result = parser.parse_email(GOVDELIVERY_EMAIL)
+        assert result["newsletter_date"] == "2026-07-02"
+        assert [(u["title"], u["category"]) for u in result["updates"]] == [
+            ("Sidewalk Shed Permits Now Expire After 90 Days", "Service Updates"),
+            ("Local Laws", "Local Laws"),
+        ]
+        shed = result["updates"][0]
+        assert shed["source_url"] == "https://links.govdelivery.com/track?abc"
+        assert shed["summary"].startswith("Starting this month, the Department requires")
+
+    def test_legacy_sections(self, parser):
+        """Header/list emails fall back to the legacy extractor, with relative links
+        made absolute."""
+        result = parser.parse_email(LEGACY_EMAIL)
+        assert result["newsletter_date"] == "2026-07-02"
+        assert [(u["title"], u["category"], u["source_url"]) for u in result["updates"]] == [
+            ("Shed renewals", "Service Updates",
+             "https://www.nyc.gov/site/buildings/news/shed.page"),
+            ("LL97 reports", "Local Laws", "https://www.nyc.gov/ll97.page"),
+        ]
+
+    def test_legacy_header_naming_two_sections(self, parser):
+        """A "Hearings + Rules" header feeds both sections, in section order."""
+        html = ("<html><body><p>07/02/2026</p><h2>Hearings + Rules</h2>"
+                "<ul><li><a href='https://www.nyc.gov/r.page'>Rule hearing</a> on sheds</li></ul>"
+                "</body></html>")
+        updates = parser.parse_email(html)["updates"]
+        assert [(u["title"], u["category"]) for u in updates] == [
+            ("Rule hearing", "Hearings"), ("Rule hearing", "Rules")]
+
+    def test_duplicate_email_served_from_cache(self, parser, monkeypatch):
+        """A re-forwarded email isn't re-parsed, and callers get their own copy."""
+        first = parser.parse_email(GOVDELIVERY_EMAIL)
+        first["updates"].clear()
+
+        def no_parse(self, html, fetch):
+            raise AssertionError("re-parsed a cached email")
+
+        monkeypatch.setattr(DOBNewsletterParser, "_parse_email", no_parse)
+        second = DOBNewsletterParser().parse_email(GOVDELIVERY_EMAIL)
+        assert len(second["updates"]) == 2
+        with pytest.raises(AssertionError):
+            parser.parse_email(GOVDELIVERY_EMAIL, fetch_linked_pages=True)
+
+
+class TestExtractDate:
+    """Tests for newsletter date extraction."""
+
+    def test_skips_unparseable_match(self, parser):
+        """A date-shaped phrase that isn't a date falls through to the next match."""
+        html = "<html><body><p>Issue 12, 2026</p><p>Sent 07/09/2026</p></body></html>"
+        assert parser.parse_email(html)["newsletter_date"] == "2026-07-09"
+
+    def test_date_past_head_scan_still_found(self, parser):
+        """A date beyond the leading text window is found by the full-text fallback."""
+        filler = "<p>" + "word " * 2000 + "</p>"
+        html = f"<html><body>{filler}<p>Sent 07/09/2026</p></body></html>"
+        assert parser.parse_email(html)["newsletter_date"] == "2026-07-09"
+
+
+class TestLinkedPages:
+    """Tests for link resolution and page fetching."""
+
+    def test_links_resolved_once_each_in_order(self, parser):
+        """Shared links resolve once; each update keeps its own link order."""
+        calls = []
+
+        def fake_resolve(url):
+            calls.append(url)
+            return url.replace("track?", "final/")
+
+        parser._resolve_url = fake_resolve
+        html = GOVDELIVERY_EMAIL.replace(
+            "due by May 1 each year going forward.</p>",
+            'due by May 1 each year going forward. '
+            '<a href="https://links.govdelivery.com/track?abc">notice</a> '
+            '<a href="https://links.govdelivery.com/track?ll97">LL97</a></p>')
+        updates = parser.parse_email(html, fetch_linked_pages=True)["updates"]
+        assert sorted(calls) == ["https://links.govdelivery.com/track?abc",
+                                 "https://links.govdelivery.com/track?ll97"]
+        assert updates[0]["referenced_links"] == ["https://links.govdelivery.com/final/abc"]
+        assert updates[1]["source_url"] == "https://links.govdelivery.com/final/abc"
+        assert updates[1]["referenced_links"] == ["https://links.govdelivery.com/final/abc",
+                                                  "https://links.govdelivery.com/final/ll97"]
+
+    def test_fetch_pages_keeps_input_order(self, parser):
+        """Concurrent fetches come back aligned with their URLs."""
+        parser._fetch_page_content = lambda url: (f"text of {url}", [])
+        urls = [f"https://www.nyc.gov/p{i}.page" for i in range(5)]
+        assert [c for c, _ in parser.fetch_pages(urls)] == [f"text of {u}" for u in urls]
+
+    def test_page_fetch_cached_across_parsers(self, parser, monkeypatch):
+        """A page fetched once is served from cache, even to a new parser."""
+        import content_engine.parser as parser_module
+        monkeypatch.setattr(parser_module, "_page_cache", parser_module.OrderedDict())
+        calls = []
+
+        def fake_download(self, url):
+            calls.append(url)
+            return "Shed rules", ["https://www.nyc.gov/shed.pdf"]
+
+        monkeypatch.setattr(DOBNewsletterParser, "_download_page_content", fake_download)
+        url = "https://www.nyc.gov/site/buildings/news/shed.page"
+        first = parser._fetch_page_content(url)
+        second = DOBNewsletterParser()._fetch_page_content(url)
+        assert first == second == ("Shed rules", ["https://www.nyc.gov/shed.pdf"])
+        assert calls == [url]
+
+    @pytest.mark.parametrize("ctype, read", [("text/html; charset=utf-8", True),
+                                             ("image/png", False)])
+    def test_page_read_is_capped_and_typed(self, parser, monkeypatch, ctype, read):
+        """HTML bodies are read up to the byte cap; non-HTML bodies aren't read."""
+        import content_engine.parser as parser_module
+        response = MagicMock(headers={"content-type": ctype},
+                             url="https://www.nyc.gov/site/buildings/a.page")
+        response.raw.read.return_value = (
+            b"<html><body><p>Shed rules</p>"
+            b"<a href='/assets/buildings/shed.pdf'>pdf</a>"
+            b"<a href='/about/contact.page'>contact</a>"
+            b"<a href='/assets/buildings/shed.pdf'>again</a></body></html>")
+        monkeypatch.setattr("core.net_guard.safe_get", lambda url, **kw: response)
+
+        content, links = parser._download_page_content(response.url)
+
+        if read:
+            response.raw.read.assert_called_once_with(parser_module._MAX_PAGE_BYTES,
+                                                      decode_content=True)
+            assert content == "Shed rules\npdf\ncontact\nagain"
+            assert links == ["https://www.nyc.gov/assets/buildings/shed.pdf"]
+        else:
+            response.raw.read.assert_not_called()
+            assert (content, links) == ("", [])
+        response.close.assert_called_once()
+
+    def test_page_head_not_in_content(self, parser, monkeypatch):
+        """Only the <body> of a linked page contributes text."""
+        response = MagicMock(headers={"content-type": "text/html"},
+                             url="https://www.nyc.gov/site/buildings/a.page")
+        response.raw.read.return_value = (
+            b"<html><head><title>NYC DOB</title><style>p{}</style></head>"
+            b"<body><p>Shed rules</p><script>track()</script></body></html>")
+        monkeypatch.setattr("core.net_guard.safe_get", lambda url, **kw: response)
+
+        assert parser._download_page_content(response.url) == ("Shed rules", [])
+
+
+@pytest.mark.parametrize("href, expected", [
+    ("/assets/buildings/a.pdf", "https://www.nyc.gov/assets/buildings/a.pdf"),
+    ("b.pdf", "https://www.nyc.gov/site/buildings/b.pdf"),
+    ("//www1.nyc.gov/c.pdf", "https://www1.nyc.gov/c.pdf"),
+    ("https://dob.example/d.pdf", "https://dob.example/d.pdf"),
+    ("#top", ""),
+    ("mailto:dob@nyc.gov", ""),
+    ("javascript:void(0)", ""),
+])
+def test_absolutize(href, expected):
+    """Links resolve against the page URL; non-navigable hrefs are dropped."""
+    from content_engine.parser import _absolutize
+    assert _absolutize(href, "https://www.nyc.gov/site/buildings/index.page") == expected
+
+
+def test_binary_links_skipped_without_request(parser, monkeypatch):
+    """Links to files with no text extractor never reach the network."""
+    def no_download(self, url):
+        raise AssertionError(f"fetched {url}")
+
+    monkeypatch.setattr(DOBNewsletterParser, "_download_page_content", no_download)
+    assert parser._fetch_page_content("https://www.nyc.gov/assets/forms.XLSX?v=2") == ("", [])